@@ -0,0 +1,145 @@
+import time
+
+import numpy as np
+
+from exe10_2 import Node, contar_nodes_left
+from exe10_4 import contar_nodos
+from percursos import level_order
+
+
+class ArvoreImplicita:
+    # Árvore binária num vetor (layout de heap / Eytzinger): o nó i tem
+    # filhos em 2i + 1 e 2i + 2, e presente[i] diz se a posição tem nó.
+    # Não existe nenhum objeto por nó, e as métricas são operações de
+    # máscara do NumPy em vez de recursão.
+    def __init__(self, values, presente=None):
+        self.values = np.asarray(values)
+        if presente is None:
+            presente = np.ones(len(self.values), dtype=bool)
+        self.presente = np.asarray(presente, dtype=bool)
+        if self.presente.shape != self.values.shape[:1]:
+            raise ValueError("values e presente precisam ter o mesmo tamanho")
+        idx = np.arange(1, len(self.presente))
+        if np.any(self.presente[1:] & ~self.presente[(idx - 1) // 2]):
+            raise ValueError("há nó presente com pai ausente")
+
+    @classmethod
+    def completa(cls, n, values=None):
+        # árvore completa com n nós (valores 0..n-1 se não vierem)
+        if values is None:
+            values = np.arange(n)
+        return cls(values)
+
+    @classmethod
+    def from_node(cls, raiz, max_size=1 << 26):
+        # converte uma árvore de Node(value, left, right); árvores muito
+        # desbalanceadas ocupam posições demais e geram ValueError
+        if raiz is None:
+            return cls(np.array([]), np.array([], dtype=bool))
+        posicoes = {id(raiz): 0}
+        pares = []
+        for node in level_order(raiz):
+            i = posicoes[id(node)]
+            if i >= max_size:
+                raise ValueError("árvore desbalanceada demais para o layout em vetor")
+            pares.append((i, node.value))
+            if node.left is not None:
+                posicoes[id(node.left)] = 2 * i + 1
+            if node.right is not None:
+                posicoes[id(node.right)] = 2 * i + 2
+        tamanho = pares[-1][0] + 1
+        values = np.empty(tamanho, dtype=object)
+        presente = np.zeros(tamanho, dtype=bool)
+        for i, v in pares:
+            values[i] = v
+            presente[i] = True
+        return cls(values, presente)
+
+    def __len__(self):
+        return self.contar_nodos()
+
+    def __filhos(self):
+        # máscaras de "tem filho esquerdo" e "tem filho direito" por posição
+        n = len(self.presente)
+        esquerdo = np.zeros(n, dtype=bool)
+        direito = np.zeros(n, dtype=bool)
+        m = n // 2                    # posições i com 2i + 1 dentro do vetor
+        esquerdo[:m] = self.presente[1:2 * m + 1:2]
+        m = (n - 1) // 2 if n else 0  # posições i com 2i + 2 dentro do vetor
+        direito[:m] = self.presente[2:2 * m + 2:2]
+        return esquerdo, direito
+
+    def folhas_mask(self):
+        esquerdo, direito = self.__filhos()
+        return self.presente & ~esquerdo & ~direito
+
+    def contar_nodos(self):
+        return int(np.count_nonzero(self.presente))
+
+    def contar_folhas(self):
+        return int(np.count_nonzero(self.folhas_mask()))
+
+    def contar_nodes_left(self):
+        # folhas em posições ímpares são filhas esquerdas
+        return int(np.count_nonzero(self.folhas_mask()[1::2]))
+
+    def altura(self):
+        presentes = np.flatnonzero(self.presente)
+        if len(presentes) == 0:
+            return 0
+        return int(presentes[-1] + 1).bit_length()
+
+    def larguras(self):
+        # quantidade de nós em cada nível
+        resposta = []
+        inicio = 0
+        while inicio < len(self.presente):
+            fim = 2 * inicio + 1
+            resposta.append(int(np.count_nonzero(self.presente[inicio:fim])))
+            inicio = fim
+        return resposta
+
+
+def _completa_com_nodes(n):
+    nodes = [Node(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    return nodes[0]
+
+
+def rodar_testes():
+    print(f"{'N':<10}{'Nodes (s)':<14}{'Implícita (s)':<16}")
+    for exp in range(10, 23, 4):
+        N = 2 ** exp
+        raiz = _completa_com_nodes(N)
+        inicio = time.time()
+        contar_nodos(raiz)
+        contar_nodes_left(raiz)
+        tempo_nodes = time.time() - inicio
+        del raiz
+
+        A = ArvoreImplicita.completa(N)
+        inicio = time.time()
+        A.contar_nodos()
+        A.contar_nodes_left()
+        A.contar_folhas()
+        tempo_implicita = time.time() - inicio
+
+        print(f"{N:<10}{tempo_nodes:<14.6f}{tempo_implicita:<16.6f}")
+
+
+if __name__ == "__main__":
+    raiz = Node(3)
+    raiz.left = Node(9)
+    raiz.right = Node(20)
+    raiz.left.left = Node(1)
+    raiz.right.left = Node(15)
+    raiz.right.right = Node(7)
+
+    A = ArvoreImplicita.from_node(raiz)
+    print(A.contar_nodos(), A.contar_folhas(), A.contar_nodes_left(), A.altura(), A.larguras())
+    # 6 3 2 3 [1, 2, 3]
+    rodar_testes()
@@ -0,0 +1,480 @@
+import random
+import time
+
+from exe10_4 import contar_nodos
+
+
+# Árvores de busca balanceadas no mesmo modelo de Node(value, left, right)
+# dos exercícios, então contar_nodos e contar_nodes_left funcionam nelas.
+# value é a chave de ordenação; data guarda um valor associado (mapa).
+
+class AVLNode:
+    __slots__ = ('value', 'left', 'right', 'height', 'data')
+
+    def __init__(self, value, data=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.data = data
+
+
+class RBNode:
+    __slots__ = ('value', 'left', 'right', 'parent', 'red', 'data')
+
+    def __init__(self, value, data=None, parent=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = parent
+        self.red = True
+        self.data = data
+
+
+class ArvoreBusca:
+    # operações que não dependem do balanceamento
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def search(self, value):
+        # devolve o nó com essa chave, ou None
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, value):
+        return self.search(value) is not None
+
+    def get(self, value, default=None):
+        node = self.search(value)
+        return default if node is None else node.data
+
+    def floor(self, x):
+        # maior chave <= x (ou None)
+        resposta = None
+        node = self.root
+        while node is not None:
+            if x < node.value:
+                node = node.left
+            else:
+                resposta = node.value
+                node = node.right
+        return resposta
+
+    def ceil(self, x):
+        # menor chave >= x (ou None)
+        resposta = None
+        node = self.root
+        while node is not None:
+            if node.value < x:
+                node = node.right
+            else:
+                resposta = node.value
+                node = node.left
+        return resposta
+
+    def min(self):
+        if self.is_empty():
+            raise Exception("Tree is empty")
+        node = self.root
+        while node.left is not None:
+            node = node.left
+        return node.value
+
+    def max(self):
+        if self.is_empty():
+            raise Exception("Tree is empty")
+        node = self.root
+        while node.right is not None:
+            node = node.right
+        return node.value
+
+    def nodes(self):
+        # em ordem, com pilha explícita (sem recursão)
+        pilha = []
+        node = self.root
+        while pilha or node is not None:
+            while node is not None:
+                pilha.append(node)
+                node = node.left
+            node = pilha.pop()
+            yield node
+            node = node.right
+
+    def __iter__(self):
+        for node in self.nodes():
+            yield node.value
+
+    def items(self):
+        for node in self.nodes():
+            yield node.value, node.data
+
+    def toArray(self):
+        return list(self)
+
+    def height(self):
+        # altura em níveis (árvore vazia = 0)
+        altura = 0
+        nivel = [self.root] if self.root is not None else []
+        while nivel:
+            altura += 1
+            nivel = [f for node in nivel for f in (node.left, node.right) if f is not None]
+        return altura
+
+    @classmethod
+    def from_sorted(cls, iterable, items=False):
+        # constrói em O(n) a partir de chaves em ordem estritamente crescente
+        # (ou pares (chave, data) com items=True), dividindo sempre no meio
+        pares = list(iterable) if items else [(v, None) for v in iterable]
+        for i in range(1, len(pares)):
+            if not pares[i - 1][0] < pares[i][0]:
+                raise ValueError("from_sorted precisa de chaves em ordem estritamente crescente")
+        arvore = cls()
+        arvore.size = len(pares)
+        # profundidade máxima do corte no meio
+        arvore.root = arvore._build(pares, 0, len(pares), 0, len(pares).bit_length() - 1)
+        return arvore
+
+
+class AVLTree(ArvoreBusca):
+    # _new_node e _update podem ser trocados por subclasses (ver ordem.py)
+    @staticmethod
+    def __h(node):
+        return 0 if node is None else node.height
+
+    def _new_node(self, value, data=None):
+        return AVLNode(value, data)
+
+    def _update(self, node):
+        node.height = 1 + max(self.__h(node.left), self.__h(node.right))
+
+    def __rotate_right(self, y):
+        x = y.left
+        y.left = x.right
+        x.right = y
+        self._update(y)
+        self._update(x)
+        return x
+
+    def __rotate_left(self, x):
+        y = x.right
+        x.right = y.left
+        y.left = x
+        self._update(x)
+        self._update(y)
+        return y
+
+    def __rebalance(self, node):
+        self._update(node)
+        fator = self.__h(node.left) - self.__h(node.right)
+        if fator > 1:
+            if self.__h(node.left.left) < self.__h(node.left.right):
+                node.left = self.__rotate_left(node.left)
+            return self.__rotate_right(node)
+        if fator < -1:
+            if self.__h(node.right.right) < self.__h(node.right.left):
+                node.right = self.__rotate_right(node.right)
+            return self.__rotate_left(node)
+        return node
+
+    def insert(self, value, data=None):
+        self.root = self.__insert(self.root, value, data)
+
+    def __insert(self, node, value, data):
+        # recursão só até a altura, O(log n)
+        if node is None:
+            self.size += 1
+            return self._new_node(value, data)
+        if value < node.value:
+            node.left = self.__insert(node.left, value, data)
+        elif node.value < value:
+            node.right = self.__insert(node.right, value, data)
+        else:
+            node.data = data
+            return node
+        return self.__rebalance(node)
+
+    def delete(self, value):
+        if value not in self:
+            raise KeyError(value)
+        self.root = self.__delete(self.root, value)
+        self.size -= 1
+
+    def __delete(self, node, value):
+        if value < node.value:
+            node.left = self.__delete(node.left, value)
+        elif node.value < value:
+            node.right = self.__delete(node.right, value)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            sucessor = node.right
+            while sucessor.left is not None:
+                sucessor = sucessor.left
+            node.value = sucessor.value
+            node.data = sucessor.data
+            node.right = self.__delete(node.right, sucessor.value)
+        return self.__rebalance(node)
+
+    def _build(self, pares, lo, hi, depth, max_depth):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._new_node(*pares[mid])
+        node.left = self._build(pares, lo, mid, depth + 1, max_depth)
+        node.right = self._build(pares, mid + 1, hi, depth + 1, max_depth)
+        self._update(node)
+        return node
+
+
+class RedBlackTree(ArvoreBusca):
+    # rubro-negra clássica (CLRS), iterativa, com ponteiro para o pai
+    @staticmethod
+    def __red(node):
+        return node is not None and node.red
+
+    def __rotate_left(self, x):
+        y = x.right
+        x.right = y.left
+        if y.left is not None:
+            y.left.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x is x.parent.left:
+            x.parent.left = y
+        else:
+            x.parent.right = y
+        y.left = x
+        x.parent = y
+
+    def __rotate_right(self, x):
+        y = x.left
+        x.left = y.right
+        if y.right is not None:
+            y.right.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x is x.parent.right:
+            x.parent.right = y
+        else:
+            x.parent.left = y
+        y.right = x
+        x.parent = y
+
+    def insert(self, value, data=None):
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                node.data = data
+                return
+        newest = RBNode(value, data, parent)
+        if parent is None:
+            self.root = newest
+        elif value < parent.value:
+            parent.left = newest
+        else:
+            parent.right = newest
+        self.size += 1
+        self.__insert_fixup(newest)
+
+    def __insert_fixup(self, z):
+        while self.__red(z.parent):
+            p = z.parent
+            g = p.parent
+            if p is g.left:
+                tio = g.right
+                if self.__red(tio):
+                    p.red = tio.red = False
+                    g.red = True
+                    z = g
+                else:
+                    if z is p.right:
+                        z = p
+                        self.__rotate_left(z)
+                        p = z.parent
+                    p.red = False
+                    g.red = True
+                    self.__rotate_right(g)
+            else:
+                tio = g.left
+                if self.__red(tio):
+                    p.red = tio.red = False
+                    g.red = True
+                    z = g
+                else:
+                    if z is p.left:
+                        z = p
+                        self.__rotate_right(z)
+                        p = z.parent
+                    p.red = False
+                    g.red = True
+                    self.__rotate_left(g)
+        self.root.red = False
+
+    def __transplant(self, u, v):
+        if u.parent is None:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        if v is not None:
+            v.parent = u.parent
+
+    def delete(self, value):
+        z = self.search(value)
+        if z is None:
+            raise KeyError(value)
+        y = z
+        y_red = y.red
+        if z.left is None:
+            x, x_parent = z.right, z.parent
+            self.__transplant(z, z.right)
+        elif z.right is None:
+            x, x_parent = z.left, z.parent
+            self.__transplant(z, z.left)
+        else:
+            y = z.right
+            while y.left is not None:
+                y = y.left
+            y_red = y.red
+            x = y.right
+            if y.parent is z:
+                x_parent = y
+            else:
+                x_parent = y.parent
+                self.__transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self.__transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.red = z.red
+        z.left = z.right = z.parent = None
+        self.size -= 1
+        if not y_red:
+            self.__delete_fixup(x, x_parent)
+
+    def __delete_fixup(self, x, parent):
+        # x (talvez None) tem um preto "a menos"; parent é o pai dele
+        while x is not self.root and not self.__red(x):
+            if x is parent.left:
+                w = parent.right
+                if w.red:
+                    w.red = False
+                    parent.red = True
+                    self.__rotate_left(parent)
+                    w = parent.right
+                if not self.__red(w.left) and not self.__red(w.right):
+                    w.red = True
+                    x = parent
+                    parent = x.parent
+                else:
+                    if not self.__red(w.right):
+                        w.left.red = False
+                        w.red = True
+                        self.__rotate_right(w)
+                        w = parent.right
+                    w.red = parent.red
+                    parent.red = False
+                    w.right.red = False
+                    self.__rotate_left(parent)
+                    x = self.root
+                    parent = None
+            else:
+                w = parent.left
+                if w.red:
+                    w.red = False
+                    parent.red = True
+                    self.__rotate_right(parent)
+                    w = parent.left
+                if not self.__red(w.left) and not self.__red(w.right):
+                    w.red = True
+                    x = parent
+                    parent = x.parent
+                else:
+                    if not self.__red(w.left):
+                        w.right.red = False
+                        w.red = True
+                        self.__rotate_left(w)
+                        w = parent.left
+                    w.red = parent.red
+                    parent.red = False
+                    w.left.red = False
+                    self.__rotate_right(parent)
+                    x = self.root
+                    parent = None
+        if x is not None:
+            x.red = False
+
+    def _build(self, pares, lo, hi, depth, max_depth, parent=None):
+        # no corte ao meio as folhas ficam nos dois últimos níveis; pintando
+        # de vermelho só o nível mais fundo, todo caminho tem o mesmo nº de pretos
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = RBNode(pares[mid][0], pares[mid][1], parent)
+        node.red = depth == max_depth and depth > 0
+        node.left = self._build(pares, lo, mid, depth + 1, max_depth, node)
+        node.right = self._build(pares, mid + 1, hi, depth + 1, max_depth, node)
+        return node
+
+
+def rodar_testes():
+    print(f"{'N':<10}{'Estrutura':<14}{'insert (s)':<14}{'search (s)':<14}{'from_sorted (s)':<16}{'altura':<8}")
+    for exp in range(10, 19, 4):
+        N = 2 ** exp
+        chaves = random.sample(range(N * 10), N)
+        for nome, cls in (("AVL", AVLTree), ("Rubro-negra", RedBlackTree)):
+            T = cls()
+            inicio = time.time()
+            for c in chaves:
+                T.insert(c)
+            tempo_insert = time.time() - inicio
+
+            inicio = time.time()
+            for c in chaves:
+                T.search(c)
+            tempo_search = time.time() - inicio
+
+            inicio = time.time()
+            cls.from_sorted(range(N))
+            tempo_bulk = time.time() - inicio
+
+            print(f"{N:<10}{nome:<14}{tempo_insert:<14.6f}{tempo_search:<14.6f}{tempo_bulk:<16.6f}{T.height():<8}")
+
+
+if __name__ == "__main__":
+    T = RedBlackTree()
+    for v in [3, 9, 20, 1, 15, 7]:
+        T.insert(v, str(v))
+    print(T.toArray(), T.floor(8), T.ceil(8), T.get(15))
+    T.delete(9)
+    print(T.toArray(), contar_nodos(T.root))
+
+    A = AVLTree.from_sorted(range(1, 11))
+    print(A.toArray(), contar_nodos(A.root), A.height())
+    rodar_testes()
@@ -0,0 +1,499 @@
+import operator
+import os
+import mmap
+import random
+import struct
+import tempfile
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import islice
+
+
+# B+-tree em disco: chaves e dados são inteiros de 64 bits ('q') guardados em
+# páginas de tamanho fixo de um arquivo lido via mmap. Nada de objeto Python
+# por chave: só as páginas que estão no cache (LRU) são decodificadas.
+#
+# Arquivo <path>:
+#   página 0        -> metadados (raiz, altura, nº de páginas, nº de chaves)
+#   páginas 1..n-1  -> folhas e nós internos
+# Folha:   cabeçalho | chaves[cap_folha]   | dados[cap_folha]
+# Interno: cabeçalho | chaves[cap_interno] | filhos[cap_interno + 1]
+#
+# Commit seguro contra queda: as páginas alteradas vão primeiro, inteiras e
+# com CRC, para o final do diário <path>.wal (só append + fsync). Depois são
+# copiadas para o arquivo principal e o diário é zerado. Se o processo cair
+# no meio, ao abrir de novo os commits completos do diário são reaplicados e
+# um commit cortado é descartado.
+#
+# Remoção é preguiçosa: tira a chave da folha sem fundir páginas (folhas
+# podem ficar vazias), e páginas liberadas não são reaproveitadas.
+
+_MAGIC = b'BPT1'
+_META = struct.Struct('<4sIqqqq')     # magic, page_size, raiz, páginas, altura, chaves
+_CAB = struct.Struct('<BHq')          # é folha?, quantidade de chaves, próxima folha
+_COMMIT = struct.Struct('<4sII')      # marca, quantidade de páginas, crc32
+_REG = struct.Struct('<q')            # número da página dentro do commit
+_MARCA = b'CMIT'
+
+
+class Pagina:
+    # versão decodificada de uma página; vals são os dados (folha) ou os
+    # números das páginas filhas (nó interno)
+    __slots__ = ('numero', 'folha', 'keys', 'vals', 'next')
+
+    def __init__(self, numero, folha, keys=None, vals=None, next=-1):
+        self.numero = numero
+        self.folha = folha
+        self.keys = array('q') if keys is None else keys
+        self.vals = array('q') if vals is None else vals
+        self.next = next
+
+
+class BPlusTreeDisco:
+    def __init__(self, path, page_size=4096, cache_pages=1024):
+        if cache_pages < 1:
+            raise ValueError("cache_pages precisa ser positivo")
+        self.path = path
+        self.wal_path = path + '.wal'
+        self.cache_pages = cache_pages
+        self.cache = OrderedDict()       # páginas limpas, da menos para a mais recente
+        self.dirty = {}                  # páginas alteradas desde o último commit
+        self.hits = 0
+        self.misses = 0
+
+        novo = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'w+b' if novo else 'r+b')
+        self.wal = open(self.wal_path, 'a+b')
+        if novo:
+            # cabeçalho sem raiz, gravado antes de tudo para que o tamanho
+            # de página já esteja no disco se a criação for interrompida
+            self.__set_page_size(page_size)
+            self.root, self.num_pages, self.height, self.size = -1, 1, 0, 0
+            self.file.write(self.__encode_meta())
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        magic, ps = _META.unpack_from(self.mm, 0)[:2]
+        if magic != _MAGIC:
+            raise ValueError(f"{path} não é um arquivo de B+-tree")
+        self.__set_page_size(ps)
+        self.__recover()
+        self.__read_meta()
+        if self.root == -1:
+            raiz = self._new_page(True)
+            self.root = raiz.numero
+            self.height = 1
+            self.commit()
+
+    def __set_page_size(self, page_size):
+        self.page_size = page_size
+        self.cap_folha = (page_size - _CAB.size) // 16
+        self.cap_interno = (page_size - _CAB.size - 8) // 16
+        if self.cap_interno < 2:
+            raise ValueError("page_size pequeno demais")
+
+    # ---------- metadados e páginas ----------
+
+    def __read_meta(self):
+        _, _, self.root, self.num_pages, self.height, self.size = _META.unpack_from(self.mm, 0)
+
+    def __encode_meta(self):
+        buf = bytearray(self.page_size)
+        _META.pack_into(buf, 0, _MAGIC, self.page_size, self.root, self.num_pages,
+                        self.height, self.size)
+        return buf
+
+    def __encode(self, pag):
+        buf = bytearray(self.page_size)
+        _CAB.pack_into(buf, 0, pag.folha, len(pag.keys), pag.next)
+        inicio = _CAB.size
+        meio = inicio + 8 * (self.cap_folha if pag.folha else self.cap_interno)
+        k = pag.keys.tobytes()
+        v = pag.vals.tobytes()
+        buf[inicio:inicio + len(k)] = k
+        buf[meio:meio + len(v)] = v
+        return buf
+
+    def __decode(self, numero):
+        base = numero * self.page_size
+        folha, n, prox = _CAB.unpack_from(self.mm, base)
+        inicio = base + _CAB.size
+        meio = inicio + 8 * (self.cap_folha if folha else self.cap_interno)
+        keys = array('q')
+        keys.frombytes(self.mm[inicio:inicio + 8 * n])
+        vals = array('q')
+        vals.frombytes(self.mm[meio:meio + 8 * (n if folha else n + 1)])
+        return Pagina(numero, bool(folha), keys, vals, prox)
+
+    def _page(self, numero):
+        pag = self.dirty.get(numero)
+        if pag is not None:
+            return pag
+        pag = self.cache.get(numero)
+        if pag is not None:
+            self.hits += 1
+            self.cache.move_to_end(numero)
+            return pag
+        self.misses += 1
+        pag = self.__decode(numero)
+        self.__cache_put(pag)
+        return pag
+
+    def __cache_put(self, pag):
+        self.cache[pag.numero] = pag
+        while len(self.cache) > self.cache_pages:
+            self.cache.popitem(last=False)
+
+    def _touch(self, pag):
+        # marca a página como alterada; ela sai do LRU e fica presa até o commit
+        self.cache.pop(pag.numero, None)
+        self.dirty[pag.numero] = pag
+
+    def _new_page(self, folha):
+        pag = Pagina(self.num_pages, folha)
+        self.num_pages += 1
+        self.dirty[pag.numero] = pag
+        return pag
+
+    def __remap(self):
+        # aumenta o arquivo (dobrando) até caber num_pages e refaz o mmap
+        atual = len(self.mm)
+        necessario = self.num_pages * self.page_size
+        if necessario <= atual:
+            return
+        tamanho = max(necessario, 2 * atual)
+        self.mm.close()
+        self.file.truncate(tamanho)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+
+    # ---------- commit e recuperação ----------
+
+    def commit(self):
+        paginas = [(numero, self.__encode(pag)) for numero, pag in self.dirty.items()]
+        paginas.append((0, self.__encode_meta()))
+        corpo = b''.join(_REG.pack(numero) + bytes(buf) for numero, buf in paginas)
+        self.wal.write(_COMMIT.pack(_MARCA, len(paginas), zlib.crc32(corpo)) + corpo)
+        self.wal.flush()
+        os.fsync(self.wal.fileno())
+        # a partir daqui o commit já é durável; falta só aplicar no arquivo
+        self.__apply(paginas)
+        for pag in self.dirty.values():
+            self.__cache_put(pag)
+        self.dirty.clear()
+
+    def rollback(self):
+        # descarta tudo desde o último commit
+        self.dirty.clear()
+        self.cache.clear()
+        self.__read_meta()
+
+    def __apply(self, paginas):
+        self.__remap()
+        for numero, buf in paginas:
+            base = numero * self.page_size
+            self.mm[base:base + self.page_size] = buf
+        self.mm.flush()
+        self.wal.truncate(0)
+        self.wal.flush()
+        os.fsync(self.wal.fileno())
+
+    def __recover(self):
+        # reaplica os commits completos do diário; para no primeiro cortado
+        self.wal.seek(0)
+        dados = self.wal.read()
+        pos = 0
+        paginas = []
+        registro = _REG.size + self.page_size
+        while pos + _COMMIT.size <= len(dados):
+            marca, n, crc = _COMMIT.unpack_from(dados, pos)
+            corpo = dados[pos + _COMMIT.size:pos + _COMMIT.size + n * registro]
+            if marca != _MARCA or len(corpo) != n * registro or zlib.crc32(corpo) != crc:
+                break
+            for i in range(0, len(corpo), registro):
+                numero = _REG.unpack_from(corpo, i)[0]
+                paginas.append((numero, corpo[i + _REG.size:i + registro]))
+            pos += _COMMIT.size + n * registro
+        # o maior número de página diz até onde o arquivo precisa ir
+        self.num_pages = max((numero + 1 for numero, _ in paginas), default=0)
+        self.__apply(paginas)
+
+    def close(self):
+        # o que não foi commitado é descartado
+        self.dirty.clear()
+        self.cache.clear()
+        self.mm.close()
+        self.file.close()
+        self.wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, erro, tb):
+        if tipo is None:
+            self.commit()
+        self.close()
+
+    # ---------- consultas ----------
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __leaf(self, value):
+        # desce até a folha que deveria conter value, guardando o caminho
+        caminho = []
+        pag = self._page(self.root)
+        while not pag.folha:
+            i = bisect_right(pag.keys, value)
+            caminho.append((pag, i))
+            pag = self._page(pag.vals[i])
+        return pag, caminho
+
+    def get(self, value, default=None):
+        pag, _ = self.__leaf(value)
+        i = bisect_left(pag.keys, value)
+        if i < len(pag.keys) and pag.keys[i] == value:
+            return pag.vals[i]
+        return default
+
+    def __contains__(self, value):
+        pag, _ = self.__leaf(value)
+        i = bisect_left(pag.keys, value)
+        return i < len(pag.keys) and pag.keys[i] == value
+
+    def range(self, lo=None, hi=None):
+        # pares (chave, data) com lo <= chave <= hi, seguindo as folhas ligadas
+        if lo is None:
+            pag = self._page(self.root)
+            while not pag.folha:
+                pag = self._page(pag.vals[0])
+            i = 0
+        else:
+            pag, _ = self.__leaf(lo)
+            i = bisect_left(pag.keys, lo)
+        while True:
+            keys = pag.keys
+            fim = len(keys) if hi is None else bisect_right(keys, hi)
+            vals = pag.vals
+            for j in range(i, fim):
+                yield keys[j], vals[j]
+            if fim < len(keys) or pag.next == -1:
+                return
+            pag = self._page(pag.next)
+            i = 0
+
+    def __iter__(self):
+        for k, _ in self.range():
+            yield k
+
+    def items(self):
+        return self.range()
+
+    def toArray(self):
+        return list(self)
+
+    def min(self):
+        for k in self:
+            return k
+        raise Exception("Tree is empty")
+
+    def max(self):
+        if self.size == 0:
+            raise Exception("Tree is empty")
+        pag = self._page(self.root)
+        while not pag.folha:
+            pag = self._page(pag.vals[-1])
+        if len(pag.keys):
+            return pag.keys[-1]
+        # a folha mais à direita ficou vazia depois de remoções
+        for k in self:
+            resposta = k
+        return resposta
+
+    # ---------- alterações ----------
+
+    def insert(self, value, data=0):
+        # chave repetida só troca o dado
+        pag, caminho = self.__leaf(value)
+        i = bisect_left(pag.keys, value)
+        self._touch(pag)
+        if i < len(pag.keys) and pag.keys[i] == value:
+            pag.vals[i] = data
+            return
+        pag.keys.insert(i, value)
+        pag.vals.insert(i, data)
+        self.size += 1
+        if len(pag.keys) <= self.cap_folha:
+            return
+
+        meio = len(pag.keys) // 2
+        nova = self._new_page(True)
+        nova.keys = pag.keys[meio:]
+        nova.vals = pag.vals[meio:]
+        del pag.keys[meio:]
+        del pag.vals[meio:]
+        nova.next = pag.next
+        pag.next = nova.numero
+        separador, direita = nova.keys[0], nova.numero
+
+        while caminho:
+            pai, i = caminho.pop()
+            self._touch(pai)
+            pai.keys.insert(i, separador)
+            pai.vals.insert(i + 1, direita)
+            if len(pai.keys) <= self.cap_interno:
+                return
+            meio = len(pai.keys) // 2
+            nova = self._new_page(False)
+            separador = pai.keys[meio]
+            nova.keys = pai.keys[meio + 1:]
+            nova.vals = pai.vals[meio + 1:]
+            del pai.keys[meio:]
+            del pai.vals[meio + 1:]
+            direita = nova.numero
+
+        raiz = self._new_page(False)
+        raiz.keys = array('q', [separador])
+        raiz.vals = array('q', [self.root, direita])
+        self.root = raiz.numero
+        self.height += 1
+
+    def delete(self, value):
+        pag, _ = self.__leaf(value)
+        i = bisect_left(pag.keys, value)
+        if i == len(pag.keys) or pag.keys[i] != value:
+            raise KeyError(value)
+        self._touch(pag)
+        del pag.keys[i]
+        del pag.vals[i]
+        self.size -= 1
+
+    # ---------- carga em lote ----------
+
+    @classmethod
+    def from_sorted(cls, path, iterable, items=False, **kwargs):
+        arvore = cls(path, **kwargs)
+        try:
+            arvore.bulk_load(iterable, items)
+        except BaseException:
+            arvore.close()
+            raise
+        return arvore
+
+    def bulk_load(self, iterable, items=False):
+        # chaves em ordem estritamente crescente (ou pares (chave, data) com
+        # items=True). As folhas são escritas cheias, direto no arquivo e em
+        # sequência, e só a primeira chave de cada página fica na memória
+        # para montar o nível de cima. Os metadados entram com um commit no
+        # final: se cair antes, a árvore continua vazia.
+        if self.size or self.dirty:
+            raise Exception("bulk_load precisa de uma árvore vazia e sem alterações pendentes")
+        blocos = self.__blocos(iterable, items)
+        fd = self.file.fileno()
+        nivel = []                      # (primeira chave, página)
+        total = 0
+        anterior = None
+        bloco = next(blocos, None)
+        while bloco is not None:
+            keys, vals = bloco
+            if anterior is not None and not anterior < keys[0]:
+                raise ValueError("bulk_load precisa de chaves em ordem estritamente crescente")
+            anterior = keys[-1]
+            seguinte = next(blocos, None)
+            numero = self.num_pages
+            self.num_pages += 1
+            prox = numero + 1 if seguinte is not None else -1
+            os.pwrite(fd, self.__encode(Pagina(numero, True, keys, vals, prox)),
+                      numero * self.page_size)
+            nivel.append((keys[0], numero))
+            total += len(keys)
+            bloco = seguinte
+        if not nivel:
+            return
+
+        altura = 1
+        while len(nivel) > 1:
+            acima = []
+            passo = self.cap_interno + 1
+            for i in range(0, len(nivel), passo):
+                grupo = nivel[i:i + passo]
+                numero = self.num_pages
+                self.num_pages += 1
+                pag = Pagina(numero, False,
+                             array('q', [k for k, _ in grupo[1:]]),
+                             array('q', [p for _, p in grupo]))
+                os.pwrite(fd, self.__encode(pag), numero * self.page_size)
+                acima.append((grupo[0][0], numero))
+            nivel = acima
+            altura += 1
+
+        os.fsync(fd)
+        self.__remap()
+        self.cache.clear()
+        self.root = nivel[0][1]
+        self.height = altura
+        self.size = total
+        self.commit()
+
+    def __blocos(self, iterable, items):
+        # fatias de cap_folha chaves como (array de chaves, array de dados)
+        it = iter(iterable)
+        while True:
+            fatia = list(islice(it, self.cap_folha))
+            if not fatia:
+                return
+            if items:
+                keys = array('q', [k for k, _ in fatia])
+                vals = array('q', [v for _, v in fatia])
+            else:
+                keys = array('q', fatia)
+                vals = array('q', [0]) * len(keys)
+            if not all(map(operator.lt, keys, islice(keys, 1, None))):
+                raise ValueError("bulk_load precisa de chaves em ordem estritamente crescente")
+            yield keys, vals
+
+
+def rodar_testes():
+    print(f"{'N':<10}{'Carga (s)':<12}{'1000 gets (s)':<16}{'Scan (s)':<12}{'Páginas':<10}")
+    with tempfile.TemporaryDirectory() as pasta:
+        for exp in range(16, 21, 2):
+            N = 2 ** exp
+            path = os.path.join(pasta, f'arvore_{N}.bpt')
+
+            inicio = time.time()
+            T = BPlusTreeDisco.from_sorted(path, range(0, 2 * N, 2), cache_pages=256)
+            tempo_carga = time.time() - inicio
+
+            consultas = [random.randrange(2 * N) for _ in range(1000)]
+            inicio = time.time()
+            for k in consultas:
+                T.get(k)
+            tempo_get = time.time() - inicio
+
+            inicio = time.time()
+            for _ in T.range():
+                pass
+            tempo_scan = time.time() - inicio
+
+            print(f"{N:<10}{tempo_carga:<12.6f}{tempo_get:<16.6f}{tempo_scan:<12.6f}{T.num_pages:<10}")
+            T.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as pasta:
+        path = os.path.join(pasta, 'demo.bpt')
+        with BPlusTreeDisco(path, page_size=256) as T:
+            for v in [50, 20, 80, 10, 30, 70, 90]:
+                T.insert(v, v * 10)
+        T = BPlusTreeDisco(path, page_size=256)
+        print(T.toArray(), len(T), T.get(70), list(T.range(15, 75)))
+        T.delete(50)
+        T.rollback()                    # volta ao que estava no disco
+        print(50 in T, T.min(), T.max())
+        T.close()
+    rodar_testes()
@@ -0,0 +1,190 @@
+import time
+from abc import ABC, abstractmethod
+
+from exe10_2 import Node, contar_nodes_left
+from exe10_4 import contar_nodos
+from percursos import is_leaf
+
+
+# Várias métricas da árvore numa única passada. Cada métrica é um
+# "visitante": recebe visit(node, depth, is_left) para cada nó e devolve o
+# resultado em result(). Uma métrica nova é só mais um visitante na mesma
+# passada, sem percurso extra.
+
+class Visitante(ABC):
+    nome = None
+
+    @abstractmethod
+    def visit(self, node, depth, is_left):
+        pass
+
+    @abstractmethod
+    def result(self):
+        pass
+
+
+class Tamanho(Visitante):
+    nome = 'size'
+
+    def __init__(self):
+        self.count = 0
+
+    def visit(self, node, depth, is_left):
+        self.count += 1
+
+    def result(self):
+        return self.count
+
+
+class Altura(Visitante):
+    # em níveis: árvore vazia = 0, só a raiz = 1
+    nome = 'height'
+
+    def __init__(self):
+        self.altura = 0
+
+    def visit(self, node, depth, is_left):
+        if depth + 1 > self.altura:
+            self.altura = depth + 1
+
+    def result(self):
+        return self.altura
+
+
+class Folhas(Visitante):
+    nome = 'leaves'
+
+    def __init__(self):
+        self.count = 0
+
+    def visit(self, node, depth, is_left):
+        if is_leaf(node):
+            self.count += 1
+
+    def result(self):
+        return self.count
+
+
+class FolhasEsquerdas(Visitante):
+    # mesmo critério de contar_nodes_left
+    nome = 'left_leaves'
+
+    def __init__(self):
+        self.count = 0
+
+    def visit(self, node, depth, is_left):
+        if is_left and is_leaf(node):
+            self.count += 1
+
+    def result(self):
+        return self.count
+
+
+class Larguras(Visitante):
+    # quantidade de nós em cada nível
+    nome = 'widths'
+
+    def __init__(self):
+        self.larguras = []
+
+    def visit(self, node, depth, is_left):
+        if depth == len(self.larguras):
+            self.larguras.append(0)
+        self.larguras[depth] += 1
+
+    def result(self):
+        return self.larguras
+
+
+class HistogramaGrau(Visitante):
+    # grau = número de filhos (0, 1 ou 2) -> quantos nós têm esse grau
+    nome = 'degrees'
+
+    def __init__(self):
+        self.graus = [0, 0, 0]
+
+    def visit(self, node, depth, is_left):
+        self.graus[(node.left is not None) + (node.right is not None)] += 1
+
+    def result(self):
+        return {0: self.graus[0], 1: self.graus[1], 2: self.graus[2]}
+
+
+class SomaValores(Visitante):
+    # exemplo de métrica extra plugável
+    nome = 'value_sum'
+
+    def __init__(self):
+        self.soma = 0
+
+    def visit(self, node, depth, is_left):
+        self.soma += node.value
+
+    def result(self):
+        return self.soma
+
+
+PADRAO = (Tamanho, Altura, Folhas, FolhasEsquerdas, Larguras, HistogramaGrau)
+
+
+def percorrer(raiz, visitantes):
+    # uma passada em pré-ordem com pilha explícita, entregando a cada
+    # visitante o nó, a profundidade e se ele é filho esquerdo
+    if raiz is None:
+        return
+    visits = [v.visit for v in visitantes]
+    pilha = [(raiz, 0, False)]
+    while pilha:
+        node, depth, is_left = pilha.pop()
+        for visit in visits:
+            visit(node, depth, is_left)
+        if node.right is not None:
+            pilha.append((node.right, depth + 1, False))
+        if node.left is not None:
+            pilha.append((node.left, depth + 1, True))
+
+
+def tree_stats(raiz, visitantes=()):
+    # visitantes: instâncias extras (além das métricas padrão)
+    todos = [cls() for cls in PADRAO] + list(visitantes)
+    percorrer(raiz, todos)
+    resposta = {}
+    for v in todos:
+        resposta[v.nome or type(v).__name__] = v.result()
+    return resposta
+
+
+def rodar_testes():
+    # passadas separadas (contar_nodos + contar_nodes_left) contra uma
+    # passada única que ainda calcula as outras quatro métricas
+    from arvore_implicita import _completa_com_nodes
+
+    print(f"{'N':<10}{'Separadas (s)':<16}{'tree_stats (s)':<16}")
+    for exp in range(10, 21, 5):
+        N = 2 ** exp
+        raiz = _completa_com_nodes(N)
+
+        inicio = time.time()
+        contar_nodos(raiz)
+        contar_nodes_left(raiz)
+        tempo_separadas = time.time() - inicio
+
+        inicio = time.time()
+        tree_stats(raiz)
+        tempo_unica = time.time() - inicio
+
+        print(f"{N:<10}{tempo_separadas:<16.6f}{tempo_unica:<16.6f}")
+
+
+if __name__ == "__main__":
+    raiz = Node(3)
+    raiz.left = Node(9)
+    raiz.right = Node(20)
+    raiz.left.left = Node(1)
+    raiz.right.left = Node(15)
+    raiz.right.right = Node(7)
+
+    print(tree_stats(raiz, [SomaValores()]))
+    # {'size': 6, 'height': 3, 'leaves': 3, 'left_leaves': 2, 'widths': [1, 2, 3],
+    #  'degrees': {0: 3, 1: 1, 2: 2}, 'value_sum': 55}
+    rodar_testes()
@@ -1,3 +1,6 @@
+from percursos import pre_order
+
+
 class Node:
     def __init__(self, value):
         self.value = value
@@ -6,7 +9,12 @@ class Node:
 
 
 def contar_nodos(raiz):
-    if raiz is None:
-        return 0
-    else:
-        return 1 + contar_nodos(raiz.left) + contar_nodos(raiz.right)
+    # nós aumentados (ordem.SizedNode) já sabem o tamanho da subárvore: O(1)
+    tamanho = getattr(raiz, 'size', None)
+    if tamanho is not None:
+        return tamanho
+    # senão, percurso com pilha explícita: não estoura a recursão em árvores fundas
+    count = 0
+    for _ in pre_order(raiz):
+        count += 1
+    return count
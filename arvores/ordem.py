@@ -0,0 +1,120 @@
+import random
+import time
+
+from balanceadas import AVLTree
+from exe10_4 import contar_nodos
+
+
+class SizedNode:
+    # nó AVL que também guarda o tamanho da própria subárvore
+    __slots__ = ('value', 'left', 'right', 'height', 'size', 'data')
+
+    def __init__(self, value, data=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.data = data
+
+
+def _size(node):
+    return 0 if node is None else node.size
+
+
+class OrderStatisticTree(AVLTree):
+    # AVL aumentada: o tamanho de cada subárvore é refeito em _update, que a
+    # AVLTree já chama em toda rotação/inserção/remoção. Com isso
+    # contar_nodos(raiz) é O(1) e select/rank/count_range são O(log n).
+    def _new_node(self, value, data=None):
+        return SizedNode(value, data)
+
+    def _update(self, node):
+        super()._update(node)
+        node.size = 1 + _size(node.left) + _size(node.right)
+
+    def select(self, k):
+        # k-ésima menor chave (k a partir de 0; negativo conta do fim)
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("k fora da árvore")
+        node = self.root
+        while True:
+            esquerda = _size(node.left)
+            if k < esquerda:
+                node = node.left
+            elif k == esquerda:
+                return node.value
+            else:
+                k -= esquerda + 1
+                node = node.right
+
+    def rank(self, x):
+        # quantas chaves são < x
+        resposta = 0
+        node = self.root
+        while node is not None:
+            if x <= node.value:
+                node = node.left
+            else:
+                resposta += _size(node.left) + 1
+                node = node.right
+        return resposta
+
+    def __rank_le(self, x):
+        # quantas chaves são <= x
+        resposta = 0
+        node = self.root
+        while node is not None:
+            if x < node.value:
+                node = node.left
+            else:
+                resposta += _size(node.left) + 1
+                node = node.right
+        return resposta
+
+    def count_range(self, lo, hi):
+        # quantas chaves estão em [lo, hi]
+        if hi < lo:
+            return 0
+        return self.__rank_le(hi) - self.rank(lo)
+
+    def __getitem__(self, k):
+        return self.select(k)
+
+
+def rodar_testes():
+    print(f"{'N':<10}{'contar_nodos (s)':<20}{'select (s)':<14}{'rank (s)':<14}")
+    for exp in range(10, 19, 4):
+        N = 2 ** exp
+        T = OrderStatisticTree.from_sorted(range(N))
+        consultas = [random.randrange(N) for _ in range(1000)]
+
+        inicio = time.time()
+        for _ in consultas:
+            contar_nodos(T.root)
+        tempo_contar = time.time() - inicio
+
+        inicio = time.time()
+        for k in consultas:
+            T.select(k)
+        tempo_select = time.time() - inicio
+
+        inicio = time.time()
+        for k in consultas:
+            T.rank(k)
+        tempo_rank = time.time() - inicio
+
+        print(f"{N:<10}{tempo_contar:<20.6f}{tempo_select:<14.6f}{tempo_rank:<14.6f}")
+
+
+if __name__ == "__main__":
+    T = OrderStatisticTree()
+    for v in [50, 20, 80, 10, 30, 70, 90]:
+        T.insert(v)
+    print(T.toArray(), contar_nodos(T.root))
+    print(T.select(0), T.select(3), T.rank(70), T.count_range(15, 75))   # 10 50 4 4
+    T.delete(50)
+    print(T.toArray(), contar_nodos(T.root), T.select(3))
+    rodar_testes()
@@ -0,0 +1,65 @@
+from collections import deque
+
+
+# Percursos sem recursão: a pilha é uma lista Python (memória do heap), então
+# árvores degeneradas com milhões de níveis não estouram o limite de
+# recursão. Funcionam com qualquer nó que tenha .left e .right.
+# Todos geram os nós (não os valores).
+
+def pre_order(raiz):
+    if raiz is None:
+        return
+    pilha = [raiz]
+    while pilha:
+        node = pilha.pop()
+        yield node
+        if node.right is not None:
+            pilha.append(node.right)
+        if node.left is not None:
+            pilha.append(node.left)
+
+
+def in_order(raiz):
+    pilha = []
+    node = raiz
+    while pilha or node is not None:
+        while node is not None:
+            pilha.append(node)
+            node = node.left
+        node = pilha.pop()
+        yield node
+        node = node.right
+
+
+def post_order(raiz):
+    # guarda o último nó visitado para saber se já voltou da direita
+    pilha = []
+    node = raiz
+    ultimo = None
+    while pilha or node is not None:
+        while node is not None:
+            pilha.append(node)
+            node = node.left
+        topo = pilha[-1]
+        if topo.right is not None and topo.right is not ultimo:
+            node = topo.right
+        else:
+            ultimo = pilha.pop()
+            yield ultimo
+
+
+def level_order(raiz):
+    if raiz is None:
+        return
+    fila = deque([raiz])
+    while fila:
+        node = fila.popleft()
+        yield node
+        if node.left is not None:
+            fila.append(node.left)
+        if node.right is not None:
+            fila.append(node.right)
+
+
+def is_leaf(node):
+    return node.left is None and node.right is None
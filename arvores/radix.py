@@ -0,0 +1,235 @@
+import os
+import sys
+import time
+
+
+class RadixNode:
+    # label: pedaço da string na aresta que chega neste nó
+    # count: quantas strings (com repetição) passam por este nó
+    # terminal: quantas vezes a string que termina aqui foi inserida
+    __slots__ = ('label', 'children', 'count', 'terminal')
+
+    def __init__(self, label=''):
+        self.label = label
+        self.children = {}          # primeiro caractere do label -> nó
+        self.count = 0
+        self.terminal = 0
+
+
+def _comum(a, b, inicio=0):
+    # tamanho do prefixo comum entre a e b[inicio:]
+    n = min(len(a), len(b) - inicio)
+    i = 0
+    while i < n and a[i] == b[inicio + i]:
+        i += 1
+    return i
+
+
+class RadixTree:
+    # Trie compactada (árvore radix) de strings, com repetição. Todo nó
+    # interno sem string terminando nele tem pelo menos dois filhos, então o
+    # maior prefixo comum do conjunto é só descer enquanto houver um único
+    # filho: O(|LCP|), não importa quantas strings existam.
+    def __init__(self, iterable=()):
+        self.root = RadixNode()
+        for s in iterable:
+            self.insert(s)
+
+    def __len__(self):
+        return self.root.count
+
+    def is_empty(self):
+        return self.root.count == 0
+
+    def insert(self, s):
+        node = self.root
+        node.count += 1
+        i = 0
+        while i < len(s):
+            child = node.children.get(s[i])
+            if child is None:
+                child = RadixNode(s[i:])
+                child.count = 1
+                child.terminal = 1
+                node.children[s[i]] = child
+                return
+            k = _comum(child.label, s, i)
+            if k < len(child.label):
+                # quebra a aresta em duas: label[:k] e label[k:]
+                meio = RadixNode(child.label[:k])
+                meio.count = child.count
+                child.label = child.label[k:]
+                meio.children[child.label[0]] = child
+                node.children[s[i]] = meio
+                child = meio
+            child.count += 1
+            node = child
+            i += k
+        node.terminal += 1
+
+    def __path(self, s):
+        # nós do caminho da raiz até onde s termina (None se s não está)
+        caminho = [self.root]
+        node = self.root
+        i = 0
+        while i < len(s):
+            node = node.children.get(s[i])
+            if node is None or not s.startswith(node.label, i):
+                return None
+            caminho.append(node)
+            i += len(node.label)
+        return caminho if node.terminal else None
+
+    def __contains__(self, s):
+        return self.__path(s) is not None
+
+    def delete(self, s):
+        # remove uma ocorrência de s
+        caminho = self.__path(s)
+        if caminho is None:
+            raise KeyError(s)
+        for node in caminho:
+            node.count -= 1
+        node = caminho[-1]
+        node.terminal -= 1
+        if node.count == 0 and len(caminho) > 1:
+            # sem nada abaixo: sai da árvore, e o pai pode ter ficado com um filho só
+            del caminho[-2].children[node.label[0]]
+            caminho.pop()
+            node = caminho[-1]
+        if node is not self.root and node.terminal == 0 and len(node.children) == 1:
+            # junta com o único filho para manter a árvore compactada
+            (filho,) = node.children.values()
+            node.label += filho.label
+            node.children = filho.children
+            node.terminal = filho.terminal
+
+    def __locus(self, prefixo):
+        # nó mais raso cujas strings começam todas com prefixo, junto com o
+        # texto da raiz até esse nó (que pode ir além do prefixo)
+        node = self.root
+        partes = []
+        i = 0
+        while i < len(prefixo):
+            node = node.children.get(prefixo[i])
+            if node is None:
+                return None, None
+            k = _comum(node.label, prefixo, i)
+            if i + k < len(prefixo) and k < len(node.label):
+                return None, None
+            partes.append(node.label)
+            i += len(node.label)
+        return node, partes
+
+    def prefix_count(self, prefixo):
+        # quantas strings (com repetição) começam com prefixo
+        node, _ = self.__locus(prefixo)
+        return 0 if node is None else node.count
+
+    def lcp(self, prefixo=''):
+        # maior prefixo comum das strings que começam com prefixo (todas, por
+        # padrão); O(|resposta|)
+        node, partes = self.__locus(prefixo)
+        if node is None or node.count == 0:
+            return ''
+        while node.terminal == 0 and len(node.children) == 1:
+            (node,) = node.children.values()
+            partes.append(node.label)
+        return ''.join(partes)
+
+    def lcp_of(self, strings):
+        # maior prefixo comum de um subconjunto das strings guardadas (KeyError
+        # se alguma não estiver): desce pelo caminho comum até que uma delas
+        # termine ou elas sigam para filhos diferentes
+        strings = list(strings)
+        for s in strings:
+            if self.__path(s) is None:
+                raise KeyError(s)
+        if not strings:
+            return ''
+        node = self.root
+        partes = []
+        i = 0
+        while True:
+            proximos = set()
+            for s in strings:
+                if len(s) == i:
+                    return ''.join(partes)
+                proximos.add(s[i])
+            if len(proximos) > 1:
+                return ''.join(partes)
+            node = node.children[proximos.pop()]
+            partes.append(node.label)
+            i += len(node.label)
+
+    def autocomplete(self, prefixo, limit=None):
+        # strings distintas que começam com prefixo, em ordem lexicográfica
+        node, partes = self.__locus(prefixo)
+        if node is None or limit == 0:
+            return
+        achadas = 0
+        pilha = [(node, ''.join(partes))]
+        while pilha:
+            node, texto = pilha.pop()
+            if node.terminal:
+                yield texto
+                achadas += 1
+                if achadas == limit:
+                    return
+            for c in sorted(node.children, reverse=True):
+                filho = node.children[c]
+                pilha.append((filho, texto + filho.label))
+
+    def __iter__(self):
+        # todas as strings, com repetição, em ordem lexicográfica
+        pilha = [(self.root, '')]
+        while pilha:
+            node, texto = pilha.pop()
+            for _ in range(node.terminal):
+                yield texto
+            for c in sorted(node.children, reverse=True):
+                filho = node.children[c]
+                pilha.append((filho, texto + filho.label))
+
+    def toArray(self):
+        return list(self)
+
+
+def rodar_testes():
+    # vetor que cresce de uma em uma string: o LCP a cada inserção,
+    # recalculando tudo com maior_prefixo_2 contra a árvore radix
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'labs'))
+    from maior_prefixo_comum import gerar_instancia, maior_prefixo_2
+
+    print(f"{'N':<10}{'Recalcular A2 (s)':<20}{'Radix (s)':<14}{'LCP só (s)':<14}")
+    for exp in range(6, 13, 2):
+        N = 2 ** exp
+        vetor = gerar_instancia(N)
+
+        inicio = time.time()
+        for i in range(1, N + 1):
+            maior_prefixo_2(vetor[:i])
+        tempo_a2 = time.time() - inicio
+
+        T = RadixTree()
+        inicio = time.time()
+        for s in vetor:
+            T.insert(s)
+            T.lcp()
+        tempo_radix = time.time() - inicio
+
+        inicio = time.time()
+        for _ in range(N):
+            T.lcp()
+        tempo_lcp = time.time() - inicio
+
+        print(f"{N:<10}{tempo_a2:<20.6f}{tempo_radix:<14.6f}{tempo_lcp:<14.6f}")
+
+
+if __name__ == "__main__":
+    T = RadixTree(["flower", "flow", "flight", "flow"])
+    print(len(T), T.lcp(), T.lcp("flo"), T.prefix_count("flo"))     # 4 fl flow 3
+    print(list(T.autocomplete("fl")), T.lcp_of(["flower", "flow"]))  # ['flight', 'flow', 'flower'] flow
+    T.delete("flight")
+    print(T.lcp(), T.toArray())                                      # flow ['flow', 'flow', 'flower']
+    rodar_testes()
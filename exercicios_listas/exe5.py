@@ -1,14 +1,165 @@
-class Node:
-    def __init__(self, element, next):
-      self.element = element
-      self.next = next
-
-class LinkedList:
-   def __init__(self):
-      self.size = 0
-    
-   def __len__(self):
-      return 0
-   
-   def __insert_between__(self, e, predecessor, succesor):
-      new = Node(e, p)
\ No newline at end of file
+from array import array
+
+
+class DynamicArray:
+    # Vetor dinâmico tipado: os elementos ficam num array.array (ex. 'q' = 8
+    # bytes por int, 'd' = 8 bytes por float) em vez de objetos int soltos.
+    # A capacidade é controlada aqui: cresce multiplicando por growth_factor
+    # e só encolhe quando sobra muito espaço (histerese), para que
+    # append/pop alternados na borda não fiquem realocando.
+    def __init__(self, typecode='q', iterable=(), growth_factor=2.0, min_capacity=8):
+        if growth_factor <= 1:
+            raise ValueError("growth_factor deve ser maior que 1")
+        self.typecode = typecode
+        self.growth_factor = growth_factor
+        self.min_capacity = min_capacity
+        self.dados = array(typecode, [0]) * min_capacity
+        self.n = 0
+        self.extend(iterable)
+
+    def __len__(self):
+        return self.n
+
+    def is_empty(self):
+        return self.n == 0
+
+    def capacity(self):
+        return len(self.dados)
+
+    def __resize(self, capacidade):
+        # BufferError aqui quer dizer que ainda existe um memoryview aberto
+        capacidade = max(capacidade, self.n, self.min_capacity)
+        atual = len(self.dados)
+        if capacidade > atual:
+            self.dados.extend(array(self.typecode, [0]) * (capacidade - atual))
+        elif capacidade < atual:
+            del self.dados[capacidade:]
+
+    def __grow_for(self, n):
+        if n > len(self.dados):
+            capacidade = len(self.dados)
+            while capacidade < n:
+                capacidade = int(capacidade * self.growth_factor) + 1
+            self.__resize(capacidade)
+
+    def __maybe_shrink(self):
+        # só encolhe abaixo de 1/growth² da capacidade, e para 1/growth.
+        # Encolher é opcional: com um memoryview aberto fica para depois.
+        capacidade = len(self.dados)
+        if capacidade > self.min_capacity and \
+                self.n < capacidade / (self.growth_factor * self.growth_factor):
+            try:
+                self.__resize(int(capacidade / self.growth_factor))
+            except BufferError:
+                pass
+
+    def reserve(self, n):
+        # garante espaço para n elementos sem realocar
+        if n > len(self.dados):
+            self.__resize(n)
+
+    def shrink_to_fit(self):
+        self.__resize(self.n)
+
+    def __check_index(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("índice fora do vetor")
+        return i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.view(i)
+        return self.dados[self.__check_index(i)]
+
+    def __setitem__(self, i, e):
+        self.dados[self.__check_index(i)] = e
+
+    def view(self, i=slice(None)):
+        # fatia sem cópia; enquanto o memoryview existir a capacidade fica
+        # presa: append/extend/insert que precisem crescer, reserve e
+        # shrink_to_fit dão BufferError (pop e clear funcionam, só não
+        # encolhem). Use "with" ou release() quando terminar.
+        return memoryview(self.dados)[:self.n][i]
+
+    def append(self, e):
+        self.__grow_for(self.n + 1)
+        self.dados[self.n] = e
+        self.n += 1
+
+    def extend(self, iterable):
+        novos = array(self.typecode, iterable)
+        if not novos:
+            # fatia vazia seria redimensionamento para o array
+            return
+        self.__grow_for(self.n + len(novos))
+        self.dados[self.n:self.n + len(novos)] = novos
+        self.n += len(novos)
+
+    def insert(self, i, e):
+        if i < 0:
+            i += self.n
+        i = max(0, min(i, self.n))
+        self.__grow_for(self.n + 1)
+        if i < self.n:
+            # fatia vazia seria redimensionamento para o array
+            self.dados[i + 1:self.n + 1] = self.dados[i:self.n]
+        self.dados[i] = e
+        self.n += 1
+
+    def pop(self, i=-1):
+        if self.is_empty():
+            raise Exception("Array is empty")
+        i = self.__check_index(i)
+        e = self.dados[i]
+        if i < self.n - 1:
+            self.dados[i:self.n - 1] = self.dados[i + 1:self.n]
+        self.n -= 1
+        self.__maybe_shrink()
+        return e
+
+    def clear(self):
+        self.n = 0
+        self.__maybe_shrink()
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self.dados[i]
+
+    def __str__(self):
+        return f"[{', '.join(str(e) for e in self)}]"
+
+    def toArray(self):
+        return self.dados[:self.n].tolist()
+
+    def nbytes(self):
+        return len(self.dados) * self.dados.itemsize
+
+
+if __name__ == "__main__":
+    import sys
+
+    A = DynamicArray('q', range(10))
+    A.append(10)
+    A.insert(0, -1)
+    print(A, len(A), A.capacity())
+    print(A.pop(), A.pop(0), A)
+
+    with A.view(slice(2, 5)) as fatia:
+        print(fatia.tolist())            # [2, 3, 4], sem copiar
+
+    for _ in range(8):
+        A.pop()
+    print(A, A.capacity())               # encolheu
+    A.reserve(1000)
+    print(A.capacity())
+    A.shrink_to_fit()
+    print(A.capacity())
+
+    n = 10**6
+    B = DynamicArray('q', range(n))
+    B.shrink_to_fit()
+    lista = list(range(n))
+    por_lista = (sys.getsizeof(lista) + sum(sys.getsizeof(x) for x in lista)) / n
+    print(f"bytes por elemento: DynamicArray {B.nbytes() / n:.1f}, list {por_lista:.1f}")
@@ -0,0 +1,170 @@
+from array import array
+
+# Lista duplamente encadeada sem objetos Node: os campos element/prev/next
+# ficam em colunas paralelas e os "ponteiros" são índices (handles) nelas.
+# As posições 0 e 1 são as sentinelas header e trailer.
+HEADER = 0
+TRAILER = 1
+
+
+class ArenaLinkedList:
+    def __init__(self, capacity=16):
+        capacity = max(capacity, 2)
+        self.element = [None] * capacity
+        self.prev = array('q', [-1]) * capacity
+        self.next = array('q', [-1]) * capacity
+        self.next[HEADER] = TRAILER
+        self.prev[TRAILER] = HEADER
+        self.livres = array('q')        # handles liberados para reuso
+        self.usados = 2                 # próximas posições nunca usadas
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __grow(self):
+        extra = len(self.element)
+        self.element.extend([None] * extra)
+        self.prev.extend(array('q', [-1]) * extra)
+        self.next.extend(array('q', [-1]) * extra)
+
+    def __new_handle(self):
+        if self.livres:
+            return self.livres.pop()
+        if self.usados == len(self.element):
+            self.__grow()
+        h = self.usados
+        self.usados += 1
+        return h
+
+    def __insert_between(self, e, predecessor, successor):
+        newest = self.__new_handle()
+        self.element[newest] = e
+        self.prev[newest] = predecessor
+        self.next[newest] = successor
+        self.next[predecessor] = newest
+        self.prev[successor] = newest
+        self.size += 1
+        return newest
+
+    def __delete_node(self, h):
+        predecessor = self.prev[h]
+        successor = self.next[h]
+        self.next[predecessor] = successor
+        self.prev[successor] = predecessor
+        self.size -= 1
+        element = self.element[h]
+        self.element[h] = None
+        self.prev[h] = self.next[h] = -1
+        self.livres.append(h)
+        return element
+
+    def first(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.element[self.next[HEADER]]
+
+    def last(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.element[self.prev[TRAILER]]
+
+    def add_first(self, e):
+        return self.__insert_between(e, HEADER, self.next[HEADER])
+
+    def add_last(self, e):
+        return self.__insert_between(e, self.prev[TRAILER], TRAILER)
+
+    def remove_first(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.__delete_node(self.next[HEADER])
+
+    def remove_last(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.__delete_node(self.prev[TRAILER])
+
+    def __iter__(self):
+        walk = self.next[HEADER]
+        while walk != TRAILER:
+            yield self.element[walk]
+            walk = self.next[walk]
+
+    def __str__(self):
+        # Para imprimir a lista (print)
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def index(self, e):
+        # Busca sequencial
+        count = -1
+        for elemento in self:
+            count += 1
+            if elemento == e:
+                return count
+        return -1
+
+    def clear(self):
+        self.__init__(len(self.element))
+
+    def concat(self, other):
+        # as arenas são independentes, então os elementos de other são
+        # copiados para o fim desta lista e other fica vazia
+        if other.is_empty():
+            return
+        for e in other:
+            self.add_last(e)
+        other.clear()
+
+    def toArray(self):
+        resposta = [None] * self.size
+        walk = self.next[HEADER]
+        count = -1
+        while walk != TRAILER:
+            count = count + 1
+            resposta[count] = self.element[walk]
+            walk = self.next[walk]
+        return resposta
+
+    def central(self):
+        # devolve o handle do nó central (como em LinkedList.central)
+        if self.is_empty():
+          raise Exception("List is empty")
+        walk1 = self.next[HEADER]
+        walk2 = self.prev[TRAILER]
+        while walk1 != walk2 and self.next[walk1] != walk2:
+            walk1 = self.next[walk1]
+            walk2 = self.prev[walk2]
+        return walk1
+
+    def copy(self):
+        # cópia em bloco: só copia as colunas, sem percorrer a lista
+        nova = ArenaLinkedList.__new__(ArenaLinkedList)
+        nova.element = self.element[:]
+        nova.prev = array('q', self.prev)
+        nova.next = array('q', self.next)
+        nova.livres = array('q', self.livres)
+        nova.usados = self.usados
+        nova.size = self.size
+        return nova
+
+
+if __name__ == "__main__":
+    L = ArenaLinkedList()
+    M = ArenaLinkedList()
+    for i in range(1, 8):
+        L.add_last(i)
+    M.add_last(8)
+    M.add_first(0)
+
+    print(L)
+    print(L.toArray())
+    print("Central:", L.element[L.central()])   # 4
+
+    L.concat(M)
+    print("L =", L)
+    print("M =", M)
+    print(L.remove_first(), L.remove_last(), L.index(5))
@@ -0,0 +1,242 @@
+import sys
+import time
+from abc import ABC, abstractmethod
+from functools import wraps
+
+from linkedlist import LinkedList
+
+
+class Cache(ABC):
+    # Cache com get/put em O(1). A ordem de despejo fica em listas
+    # duplamente encadeadas indexadas (LinkedList(indexed=True)), então
+    # mover/remover uma chave não precisa de busca sequencial.
+    def __init__(self, max_size=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.dados = {}          # chave -> [valor, bytes, instante de expiração]
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # cada política implementa estes quatro
+    @abstractmethod
+    def _add(self, key):
+        pass
+
+    @abstractmethod
+    def _touch(self, key):
+        pass
+
+    @abstractmethod
+    def _remove(self, key):
+        pass
+
+    @abstractmethod
+    def _victim(self):
+        pass
+
+    def __len__(self):
+        return len(self.dados)
+
+    def __contains__(self, key):
+        entrada = self.dados.get(key)
+        return entrada is not None and not self.__expired(entrada)
+
+    def __expired(self, entrada):
+        return entrada[2] is not None and entrada[2] <= time.monotonic()
+
+    def __discard(self, key):
+        self._remove(key)
+        self.bytes -= self.dados.pop(key)[1]
+
+    def get(self, key, default=None):
+        entrada = self.dados.get(key)
+        if entrada is None:
+            self.misses += 1
+            return default
+        if self.__expired(entrada):
+            self.__discard(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(key)
+        return entrada[0]
+
+    def put(self, key, value):
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # sozinho já estoura o orçamento: não guarda
+            if key in self.dados:
+                self.__discard(key)
+            return
+        expira = time.monotonic() + self.ttl if self.ttl is not None else None
+        entrada = self.dados.get(key)
+        if entrada is not None:
+            self.bytes += nbytes - entrada[1]
+            entrada[0] = value
+            entrada[1] = nbytes
+            entrada[2] = expira
+            self._touch(key)
+            self.__evict(0, 0)
+        else:
+            # abre espaço antes de inserir, senão a LFU despejaria a chave nova
+            self.__evict(1, nbytes)
+            self.dados[key] = [value, nbytes, expira]
+            self.bytes += nbytes
+            self._add(key)
+
+    def __evict(self, novos, nbytes):
+        while self.dados and (len(self.dados) + novos > self.max_size or
+                (self.max_bytes is not None and self.bytes + nbytes > self.max_bytes)):
+            self.__discard(self._victim())
+            self.evictions += 1
+
+    def delete(self, key):
+        if key not in self.dados:
+            raise KeyError(key)
+        self.__discard(key)
+
+    def clear(self):
+        for key in list(self.dados):
+            self.__discard(key)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self.dados),
+            'bytes': self.bytes,
+        }
+
+
+class LRUCache(Cache):
+    # chaves da mais recente (início) para a menos recente (fim)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ordem = LinkedList(indexed=True)
+
+    def _add(self, key):
+        self.ordem.add_first(key)
+
+    def _touch(self, key):
+        self.ordem.move_to_front(key)
+
+    def _remove(self, key):
+        self.ordem.remove(key)
+
+    def _victim(self):
+        return self.ordem.last()
+
+
+class LFUCache(Cache):
+    # uma lista por frequência de acesso; empate decidido por LRU
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.freq = {}           # chave -> frequência
+        self.buckets = {}        # frequência -> LinkedList de chaves
+        self.min_freq = 0
+
+    def __bucket(self, f):
+        bucket = self.buckets.get(f)
+        if bucket is None:
+            bucket = self.buckets[f] = LinkedList(indexed=True)
+        return bucket
+
+    def __leave_bucket(self, key, f):
+        bucket = self.buckets[f]
+        bucket.remove(key)
+        if bucket.is_empty():
+            del self.buckets[f]
+
+    def _add(self, key):
+        self.freq[key] = 1
+        self.__bucket(1).add_first(key)
+        self.min_freq = 1
+
+    def _touch(self, key):
+        f = self.freq[key]
+        self.__leave_bucket(key, f)
+        if self.min_freq == f and f not in self.buckets:
+            self.min_freq = f + 1
+        self.freq[key] = f + 1
+        self.__bucket(f + 1).add_first(key)
+
+    def _remove(self, key):
+        self.__leave_bucket(key, self.freq.pop(key))
+
+    def _victim(self):
+        if self.min_freq not in self.buckets:
+            # só acontece depois de delete(); recalcula a menor frequência
+            self.min_freq = min(self.buckets)
+        return self.buckets[self.min_freq].last()
+
+
+POLITICAS = {'lru': LRUCache, 'lfu': LFUCache}
+
+
+def make_cache(policy='lru', **kwargs):
+    if policy not in POLITICAS:
+        raise ValueError(f"política desconhecida: {policy}")
+    return POLITICAS[policy](**kwargs)
+
+
+_KWD_MARK = object()
+_MISSING = object()
+
+
+def memoize(max_size=128, max_bytes=None, ttl=None, policy='lru', sizeof=sys.getsizeof):
+    # @memoize(...) guarda os resultados da função em um Cache;
+    # argumentos precisam ser hashable
+    def decorator(func):
+        cache = make_cache(policy, max_size=max_size, max_bytes=max_bytes,
+                           ttl=ttl, sizeof=sizeof)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+            resultado = cache.get(key, _MISSING)
+            if resultado is _MISSING:
+                resultado = func(*args, **kwargs)
+                cache.put(key, resultado)
+            return resultado
+
+        wrapper.cache = cache
+        wrapper.cache_stats = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    C = LRUCache(max_size=2)
+    C.put('a', 1)
+    C.put('b', 2)
+    C.get('a')
+    C.put('c', 3)                    # despeja 'b' (menos recente)
+    print('b' in C, 'a' in C, C.stats())
+
+    F = LFUCache(max_size=2)
+    F.put('a', 1)
+    F.put('b', 2)
+    F.get('a')
+    F.get('a')
+    F.get('b')
+    F.put('c', 3)                    # despeja 'b' (menos frequente)
+    print('b' in F, 'a' in F, F.stats())
+
+    @memoize(max_size=1000)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(200), fib.cache_stats())
@@ -0,0 +1,220 @@
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+from node import Node
+
+
+class ConcurrentLinkedList:
+    # Deque encadeado seguro entre threads, com um lock para cada ponta
+    # (fila de dois locks de Michael & Scott): quem insere no fim só pega
+    # tail_lock e quem remove do início só pega head_lock, então produtores
+    # e consumidores não disputam o mesmo lock.
+    # O header é um nó "dummy": remover do início transforma o primeiro nó
+    # no novo dummy, e assim as duas pontas nunca mexem no mesmo campo.
+    # add_first e remove_last mexem nas duas pontas e pegam os dois locks
+    # (sempre na ordem head_lock -> tail_lock).
+    def __init__(self):
+        self.header = Node(None, None, None)
+        self.tail = self.header
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
+        # um "vale" por elemento: quem remove pega um antes, então nunca
+        # encontra a lista vazia, e pode esperar com timeout
+        self.disponiveis = threading.Semaphore(0)
+        self.adicionados = 0             # só muda com tail_lock
+        self.removidos = 0               # só muda com head_lock
+
+    def __len__(self):
+        return self.adicionados - self.removidos
+
+    def is_empty(self):
+        return len(self) == 0
+
+    def add_last(self, e):
+        newest = Node(e, None, None)
+        with self.tail_lock:
+            newest.prev = self.tail
+            self.tail.next = newest
+            self.tail = newest
+            self.adicionados += 1
+        self.disponiveis.release()
+
+    def extend(self, iterable):
+        # insere em lote, com uma só aquisição do lock
+        first = last = None
+        count = 0
+        for e in iterable:
+            newest = Node(e, last, None)
+            if last is None:
+                first = newest
+            else:
+                last.next = newest
+            last = newest
+            count += 1
+        if count == 0:
+            return
+        with self.tail_lock:
+            first.prev = self.tail
+            self.tail.next = first
+            self.tail = last
+            self.adicionados += count
+        self.disponiveis.release(count)
+
+    def add_first(self, e):
+        with self.head_lock, self.tail_lock:
+            newest = Node(e, self.header, self.header.next)
+            if self.header.next is None:
+                self.tail = newest
+            else:
+                self.header.next.prev = newest
+            self.header.next = newest
+            self.adicionados += 1
+        self.disponiveis.release()
+
+    def __take(self, block, timeout):
+        if not self.disponiveis.acquire(block, timeout if block else None):
+            raise queue.Empty("List is empty")
+
+    def remove_first(self, block=True, timeout=None):
+        # bloqueia até haver elemento (ou até timeout segundos)
+        self.__take(block, timeout)
+        with self.head_lock:
+            first = self.header.next
+            element = first.element
+            # o primeiro nó vira o novo dummy
+            first.element = None
+            first.prev = None
+            self.header.next = None
+            self.header = first
+            self.removidos += 1
+        return element
+
+    def remove_last(self, block=True, timeout=None):
+        self.__take(block, timeout)
+        with self.head_lock, self.tail_lock:
+            last = self.tail
+            self.tail = last.prev
+            self.tail.next = None
+            self.removidos += 1
+            element = last.element
+            last.prev = last.element = None
+        return element
+
+    # nomes de fila
+    put = add_last
+    pop = remove_first
+
+    def drain(self, n, block=False, timeout=None):
+        # remove até n elementos do início de uma vez (uma aquisição do lock);
+        # com block=True espera pelo menos o primeiro
+        count = 0
+        if n > 0 and block:
+            self.__take(True, timeout)
+            count = 1
+        while count < n and self.disponiveis.acquire(False):
+            count += 1
+        resposta = [None] * count
+        if count == 0:
+            return resposta
+        with self.head_lock:
+            walk = self.header
+            for i in range(count):
+                walk = walk.next
+                resposta[i] = walk.element
+                walk.element = None
+            walk.prev = None
+            self.header.next = None
+            self.header = walk
+            self.removidos += count
+        return resposta
+
+    def toArray(self):
+        # cópia consistente (pega os dois locks)
+        with self.head_lock, self.tail_lock:
+            resposta = []
+            walk = self.header.next
+            while walk is not None:
+                resposta.append(walk.element)
+                walk = walk.next
+            return resposta
+
+    def __str__(self):
+        # Para imprimir a lista (print)
+        return '( ' + ''.join(f'{e} ' for e in self.toArray()) + ')'
+
+
+# -------------------------------
+# Vazão com várias threads
+# -------------------------------
+class DequeComLock:
+    # referência: deque comum protegido por um único lock + condição
+    def __init__(self):
+        self.dados = deque()
+        self.cond = threading.Condition()
+
+    def put(self, e):
+        with self.cond:
+            self.dados.append(e)
+            self.cond.notify()
+
+    def pop(self, block=True, timeout=None):
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.dados, timeout):
+                raise queue.Empty("List is empty")
+            return self.dados.popleft()
+
+
+def medir(put, get, produtores, consumidores, por_produtor):
+    total = produtores * por_produtor
+
+    def produzir():
+        for i in range(por_produtor):
+            put(i)
+
+    def consumir(quantos):
+        while quantos > 0:
+            quantos -= get(quantos)
+
+    base, resto = divmod(total, consumidores)
+    threads = [threading.Thread(target=produzir) for _ in range(produtores)]
+    threads += [threading.Thread(target=consumir, args=(base + (i < resto),))
+                for i in range(consumidores)]
+    inicio = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return total / (time.time() - inicio)
+
+
+def um_por_vez(pop):
+    # adapta pop() para a interface de medir (devolve quantos tirou)
+    def get(quantos):
+        pop()
+        return 1
+    return get
+
+
+def rodar_testes():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'ativo' if gil else 'desativado (free-threaded)'}")
+    print(f"{'Threads (P/C)':<16}{'Concurrent (ops/s)':<22}{'Concurrent+drain (ops/s)':<28}{'deque+lock (ops/s)':<22}{'queue.Queue (ops/s)':<22}")
+    for threads in (1, 2, 4, 8):
+        por_produtor = 200000 // threads
+        C = ConcurrentLinkedList()
+        a = medir(C.put, um_por_vez(C.pop), threads, threads, por_produtor)
+        C = ConcurrentLinkedList()
+        b = medir(C.put, lambda quantos, C=C: len(C.drain(min(quantos, 64), block=True)),
+                  threads, threads, por_produtor)
+        D = DequeComLock()
+        c = medir(D.put, um_por_vez(D.pop), threads, threads, por_produtor)
+        Q = queue.Queue()
+        d = medir(Q.put, um_por_vez(Q.get), threads, threads, por_produtor)
+        print(f"{f'{threads}/{threads}':<16}{a:<22.0f}{b:<28.0f}{c:<22.0f}{d:<22.0f}")
+
+
+if __name__ == "__main__":
+    rodar_testes()
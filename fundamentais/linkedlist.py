@@ -1,16 +1,204 @@
+import pickle
+import struct
+from array import array
+from weakref import WeakSet
+
 from node import Node
 from node import Node2
+from persistent_list import PersistentList
+
+_LEN = struct.Struct('<Q')
+
+
+def _read_exact(fp, n):
+    dados = fp.read(n)
+    if len(dados) != n:
+        raise EOFError("arquivo da lista terminou antes do esperado")
+    return dados
+
+
+def _numeric_array(bloco):
+    # array.array do bloco se for todo int de 64 bits ou todo float; senão None
+    tipos = set(map(type, bloco))
+    if tipos == {float}:
+        return array('d', bloco)
+    if tipos == {int}:
+        try:
+            return array('q', bloco)
+        except OverflowError:
+            return None
+    return None
+
+
+# ---- auxiliares do merge sort ----
+# Durante a ordenação as correntes ficam ligadas só por next (terminando
+# em None) e o campo prev de cada nó guarda temporariamente a sua chave;
+# os prev verdadeiros são refeitos no fim.
+
+def _detach_chain(L, key):
+    # tira os nós de L como corrente simples, com a chave em prev
+    if L.is_empty():
+        return None
+    L._before_change()
+    walk = L.header.next
+    try:
+        while walk is not L.trailer:
+            walk.prev = walk.element if key is None else key(walk.element)
+            walk = walk.next
+    except Exception:
+        # key falhou: refaz os prev e deixa a lista como estava
+        _attach_chain(L, L.header.next)
+        raise
+    first = L.header.next
+    L.trailer.prev.next = None
+    L.header.next = L.trailer
+    L.trailer.prev = L.header
+    return first
+
+
+def _attach_chain(L, first):
+    # recoloca a corrente em L, refazendo os prev
+    predecessor = L.header
+    walk = first
+    while walk is not None and walk is not L.trailer:
+        predecessor.next = walk
+        walk.prev = predecessor
+        predecessor = walk
+        walk = walk.next
+    predecessor.next = L.trailer
+    L.trailer.prev = predecessor
+
+
+def _cut(node, n):
+    # separa os n primeiros nós da corrente e devolve o resto
+    for _ in range(n - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_chains(a, b, reverse, tail=None):
+    # intercalação estável: em empate fica o nó de a. O resultado é ligado
+    # depois de tail (se vier). Se a comparação falhar, o que já foi
+    # intercalado, o resto de a e o resto de b ficam numa corrente só depois
+    # do tail inicial, sem perder nó, e o erro é repassado.
+    start = Node(None, None, None) if tail is None else tail
+    tail = start
+    try:
+        while a is not None and b is not None:
+            if (b.prev > a.prev) if reverse else (b.prev < a.prev):
+                tail.next = b
+                tail = b
+                b = b.next
+            else:
+                tail.next = a
+                tail = a
+                a = a.next
+    except Exception:
+        tail.next = a if a is not None else b
+        if a is not None:
+            while tail.next is not None:
+                tail = tail.next
+            tail.next = b
+        raise
+    tail.next = a if a is not None else b
+    while tail.next is not None:
+        tail = tail.next
+    return start.next, tail
+
+
+def _keyed_nodes(L, key):
+    # põe a chave de cada nó em prev e devolve os nós na ordem da lista;
+    # se key falhar, refaz os prev e deixa L como estava. Os snapshots vivos
+    # são copiados antes, porque eles leem a lista pelos prev
+    L._before_change()
+    nodes = []
+    walk = L.header.next
+    try:
+        while walk is not L.trailer:
+            walk.prev = walk.element if key is None else key(walk.element)
+            nodes.append(walk)
+            walk = walk.next
+    except Exception:
+        _attach_chain(L, L.header.next)
+        raise
+    return nodes
+
+
+def _relink(nodes):
+    # refaz a corrente simples (terminada em None) na ordem de nodes
+    for i in range(len(nodes) - 1):
+        nodes[i].next = nodes[i + 1]
+    nodes[-1].next = None
+    return nodes[0]
+
+
+def merge_sorted(*lists, key=None, reverse=False):
+    # intercala k listas já ordenadas em uma nova LinkedList, religando
+    # os nós (as listas de entrada ficam vazias); O(n log k). Se key ou
+    # uma comparação falhar, cada lista volta a ser o que era.
+    origens = []
+    try:
+        for L in lists:
+            origens.append((L, _keyed_nodes(L, key)))
+    except Exception:
+        for L, _ in origens:
+            _attach_chain(L, L.header.next)
+        raise
+    chains = []
+    for L, nodes in origens:
+        if nodes:
+            L.header.next = L.trailer
+            L.trailer.prev = L.header
+            chains.append((_relink(nodes), len(nodes)))
+    resposta = LinkedList()
+    try:
+        while len(chains) > 1:
+            pares = []
+            for i in range(0, len(chains) - 1, 2):
+                head, _ = _merge_chains(chains[i][0], chains[i + 1][0], reverse)
+                pares.append((head, chains[i][1] + chains[i + 1][1]))
+            if len(chains) % 2 == 1:
+                pares.append(chains[-1])
+            chains = pares
+    except Exception:
+        for L, nodes in origens:
+            if nodes:
+                _attach_chain(L, _relink(nodes))
+        raise
+    for L, _ in origens:
+        L.size = 0
+        L.meio = None
+        if L.indice is not None:
+            L.indice = {}
+    if chains:
+        _attach_chain(resposta, chains[0][0])
+        resposta.size = chains[0][1]
+    return resposta
+
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, pool=None, indexed=False, track_middle=False):
         self.header = Node(None, None, None)
         self.trailer = Node(None, None, None)
         self.header.next = self.trailer
         self.trailer.prev = self.header
         self.size = 0
-    
-    def __init__(self):
-        self.size = 0
+        # pool opcional (NodePool) de onde os nós são tirados e devolvidos
+        self.pool = pool
+        # modo indexado: dicionário elemento -> nós que guardam esse elemento
+        self.indice = {} if indexed else None
+        # ponteiro para o nó central (índice (n - 1) // 2), mantido a cada
+        # operação nas pontas; None quando precisa ser recalculado
+        self.track_middle = track_middle
+        self.meio = None
+        # snapshots (PersistentList) que ainda leem direto desta lista
+        self.snapshots = None
         self.head = None
         self.tail = None
     
@@ -72,20 +260,36 @@ class LinkedList:
         return self.size == 0
 
     def __insert_between(self, e, predecessor, successor):
-        newest = Node(e, predecessor, successor)
+        if self.snapshots:
+            self._before_change()
+        if self.pool is not None:
+            newest = self.pool.acquire(e, predecessor, successor)
+        else:
+            newest = Node(e, predecessor, successor)
         predecessor.next = newest
         successor.prev = newest
         self.size += 1
+        if self.indice is not None:
+            self.indice.setdefault(e, {})[newest] = None
         return newest
 
     def __delete_node(self, node):
+        if self.snapshots:
+            self._before_change()
         predecessor = node.prev
         successor = node.next
         predecessor.next = successor
         successor.prev = predecessor
         self.size -= 1
         element = node.element
+        if self.indice is not None:
+            nodes = self.indice[element]
+            del nodes[node]
+            if not nodes:
+                del self.indice[element]
         node.prev = node.next = node.element = None
+        if self.pool is not None:
+            self.pool.release(node)
         return element
 
     def first(self):
@@ -99,30 +303,106 @@ class LinkedList:
         return self.trailer.prev.element
 
     def add_first(self, e):
-        self.__insert_between(e, self.header, self.header.next)
+        newest = self.__insert_between(e, self.header, self.header.next)
+        if self.track_middle:
+            if self.size == 1:
+                self.meio = newest
+            elif self.meio is not None and self.size % 2 == 0:
+                self.meio = self.meio.prev
 
     def add_last(self, e):
-        self.__insert_between(e, self.trailer.prev, self.trailer)
+        newest = self.__insert_between(e, self.trailer.prev, self.trailer)
+        if self.track_middle:
+            if self.size == 1:
+                self.meio = newest
+            elif self.meio is not None and self.size % 2 == 1:
+                self.meio = self.meio.next
 
     def remove_first(self):
         if self.is_empty():
           raise Exception("List is empty")
+        if self.track_middle and self.meio is not None:
+            if self.size == 1:
+                self.meio = None
+            elif self.size % 2 == 0:
+                self.meio = self.meio.next
         return self.__delete_node(self.header.next)
 
     def remove_last(self):
         if self.is_empty():
           raise Exception("List is empty")
+        if self.track_middle and self.meio is not None:
+            if self.size == 1:
+                self.meio = None
+            elif self.size % 2 == 1:
+                self.meio = self.meio.prev
         return self.__delete_node(self.trailer.prev)
 
     def __str__(self):
-        # Para imprimir a lista (print)
-        answer = '( '
-        walk = self.header.next
-        while walk != self.trailer:
-            answer += f'{walk.element} '
-            walk = walk.next
-        answer += ')'
-        return answer
+        # Para imprimir a lista (print); join é linear, += pode ser quadrático
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def __chunks(self, chunk_size):
+        # percorre a lista em blocos de até chunk_size elementos
+        bloco = []
+        for e in self:
+            bloco.append(e)
+            if len(bloco) == chunk_size:
+                yield bloco
+                bloco = []
+        if bloco:
+            yield bloco
+
+    def write_to(self, fp, chunk_size=4096):
+        # escreve o mesmo texto de __str__ em fp, um bloco por vez
+        fp.write('( ')
+        for bloco in self.__chunks(chunk_size):
+            fp.write(''.join(f'{e} ' for e in bloco))
+        fp.write(')')
+
+    def dump(self, fp, chunk_size=65536):
+        # serialização binária em blocos (fp aberto em 'wb'):
+        #   [u64 tamanho do pickle][pickle][u64 nº de buffers]([u64 tamanho][bytes])*
+        # blocos só de int ou só de float viram array.array e vão como buffer
+        # fora do pickle (protocolo 5), escritos direto da memória do array;
+        # um pickle de tamanho 0 marca o fim
+        for bloco in self.__chunks(chunk_size):
+            dados = _numeric_array(bloco)
+            buffers = []
+            if dados is None:
+                payload = pickle.dumps(bloco, protocol=5)
+            else:
+                payload = pickle.dumps((dados.typecode, pickle.PickleBuffer(dados)),
+                                       protocol=5, buffer_callback=buffers.append)
+            fp.write(_LEN.pack(len(payload)))
+            fp.write(payload)
+            fp.write(_LEN.pack(len(buffers)))
+            for buf in buffers:
+                raw = buf.raw()
+                fp.write(_LEN.pack(raw.nbytes))
+                fp.write(raw)
+        fp.write(_LEN.pack(0))
+
+    @classmethod
+    def load(cls, fp, pool=None, indexed=False, track_middle=False):
+        L = cls(pool, indexed, track_middle)
+        while True:
+            (tamanho,) = _LEN.unpack(_read_exact(fp, _LEN.size))
+            if tamanho == 0:
+                return L
+            payload = _read_exact(fp, tamanho)
+            (n_buffers,) = _LEN.unpack(_read_exact(fp, _LEN.size))
+            buffers = []
+            for _ in range(n_buffers):
+                (nbytes,) = _LEN.unpack(_read_exact(fp, _LEN.size))
+                buffers.append(bytearray(_read_exact(fp, nbytes)))
+            bloco = pickle.loads(payload, buffers=buffers)
+            if isinstance(bloco, tuple):
+                typecode, buf = bloco
+                dados = array(typecode)
+                dados.frombytes(buf)
+                bloco = dados
+            L.extend(bloco)
 
     def index(self, e):
         # Busca sequencial
@@ -137,13 +417,22 @@ class LinkedList:
         return -1
     
     def clear(self):
+        self._before_change()
         self.header.next = self.trailer
         self.trailer.prev = self.header
         self.size = 0
+        self.meio = None
+        if self.indice is not None:
+            self.indice.clear()
 
     def concat(self, other):
       if other.is_empty():
           return
+      self._before_change()
+      other._before_change()
+      n = self.size
+      meio_other = other.meio if other.track_middle else None
+      primeiro_other = other.header.next
 
       if self.is_empty():
           # se L está vazia, L' é simplesmente other
@@ -167,6 +456,39 @@ class LinkedList:
           # soma os tamanhos
           self.size += other.size
 
+      # os nós passam a ser de L no índice também
+      if self.indice is not None:
+          if other.indice is not None:
+              for e, nodes in other.indice.items():
+                  self.indice.setdefault(e, {}).update(nodes)
+          else:
+              walk = self.trailer.prev
+              for _ in range(other.size):
+                  self.indice.setdefault(walk.element, {})[walk] = None
+                  walk = walk.prev
+
+      # o novo meio sai do meio que estiver mais perto: o de L, o de M
+      # ou o primeiro nó de M (O(min(n, m)) passos, e não O(n + m))
+      if self.track_middle:
+          m = self.size - n
+          alvo = (self.size - 1) // 2
+          candidatos = [(primeiro_other, alvo - n)]
+          if n > 0 and self.meio is not None:
+              candidatos.append((self.meio, alvo - (n - 1) // 2))
+          if meio_other is not None:
+              candidatos.append((meio_other, alvo - n - (m - 1) // 2))
+          node, delta = min(candidatos, key=lambda c: abs(c[1]))
+          self.meio = self.__walk(node, delta)
+
+      # M fica vazia, com um trailer novo (o antigo agora é de L)
+      other.trailer = Node(None, None, None)
+      other.header.next = other.trailer
+      other.trailer.prev = other.header
+      other.size = 0
+      other.meio = None
+      if other.indice is not None:
+          other.indice = {}
+
     def toArray(self):
       resposta = [None] * self.__len__()
       elemento = self.header.next
@@ -176,6 +498,94 @@ class LinkedList:
         resposta[count] = elemento.element
         elemento = elemento.next
       return resposta
+
+    @classmethod
+    def from_iterable(cls, iterable, pool=None, indexed=False, track_middle=False):
+        L = cls(pool, indexed, track_middle)
+        L.extend(iterable)
+        return L
+
+    def __build_chain(self, iterable):
+        # monta a corrente de nós de uma vez, fora da lista;
+        # devolve (primeiro, último, quantidade)
+        anchor = Node(None, None, None)
+        walk = anchor
+        count = 0
+        pool = self.pool
+        for e in iterable:
+            if pool is not None:
+                newest = pool.acquire(e, walk, None)
+            else:
+                newest = Node(e, walk, None)
+            walk.next = newest
+            walk = newest
+            count += 1
+        first = anchor.next
+        if first is not None:
+            first.prev = None
+        return first, walk, count
+
+    def __splice_chain(self, first, last, count, predecessor, successor):
+        # encaixa a corrente pronta entre predecessor e successor em O(1)
+        if count == 0:
+            return
+        self._before_change()
+        first.prev = predecessor
+        last.next = successor
+        predecessor.next = first
+        successor.prev = last
+        self.size += count
+        if self.indice is not None:
+            walk = first
+            while walk is not successor:
+                self.indice.setdefault(walk.element, {})[walk] = None
+                walk = walk.next
+
+    def extend(self, iterable):
+        n = self.size
+        first, last, count = self.__build_chain(iterable)
+        self.__splice_chain(first, last, count, self.trailer.prev, self.trailer)
+        if self.track_middle and count:
+            if n == 0 or self.meio is None:
+                self.meio = None
+            else:
+                self.meio = self.__walk(self.meio, (self.size - 1) // 2 - (n - 1) // 2)
+
+    def extendleft(self, iterable):
+        # como deque.extendleft: os elementos entram invertidos no início
+        n = self.size
+        first, last, count = self.__build_chain(reversed(list(iterable)))
+        self.__splice_chain(first, last, count, self.header, self.header.next)
+        if self.track_middle and count:
+            if n == 0 or self.meio is None:
+                self.meio = None
+            else:
+                self.meio = self.__walk(self.meio, (self.size - 1) // 2 - (n - 1) // 2 - count)
+
+    def __iter__(self):
+        walk = self.header.next
+        trailer = self.trailer
+        while walk is not trailer:
+            yield walk.element
+            walk = walk.next
+
+    def __reversed__(self):
+        walk = self.trailer.prev
+        header = self.header
+        while walk is not header:
+            yield walk.element
+            walk = walk.prev
+
+    def to_array(self, typecode='q'):
+        # array.array compacto (typecode como em array.array, ex. 'q', 'd');
+        # typecode='numpy' (ou um dtype) devolve um numpy.ndarray
+        if typecode == 'numpy' or not isinstance(typecode, str):
+            import numpy
+            dtype = None if typecode == 'numpy' else typecode
+            if dtype is None:
+                return numpy.array(self.toArray())
+            return numpy.fromiter(self, dtype=dtype, count=self.size)
+        return array(typecode, self)
     
     def size(self):
         count = 0
@@ -186,9 +596,246 @@ class LinkedList:
         return count
     
     def central(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        if self.track_middle and self.meio is not None:
+            return self.meio
         walk1 = self.header.next     
         walk2 = self.trailer.prev     
         while walk1 != walk2 and walk1.next != walk2: 
             walk1 = walk1.next
             walk2 = walk2.prev
+        if self.track_middle:
+            self.meio = walk1
         return walk1
+
+    def __walk(self, node, delta):
+        # anda delta nós para frente (ou para trás, se negativo)
+        while delta > 0:
+            node = node.next
+            delta -= 1
+        while delta < 0:
+            node = node.prev
+            delta += 1
+        return node
+
+    def __find(self, e):
+        # primeira ocorrência de e pela posição, nos dois modos. No modo
+        # indexado é O(1) se e for único; com repetidos anda desde o início
+        # até achar um dos nós do índice
+        if self.indice is not None:
+            nodes = self.indice.get(e)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return next(iter(nodes))
+            walk = self.header.next
+            while walk not in nodes:
+                walk = walk.next
+            return walk
+        walk = self.header.next
+        while walk != self.trailer:
+            if walk.element == e:
+                return walk
+            walk = walk.next
+        return None
+
+    def __relink(self, node, predecessor, successor):
+        if self.snapshots:
+            self._before_change()
+        # tira o nó de onde está e o recoloca entre predecessor e successor
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = predecessor
+        node.next = successor
+        predecessor.next = node
+        successor.prev = node
+
+    def __contains__(self, e):
+        return self.__find(e) is not None
+
+    def remove(self, e):
+        node = self.__find(e)
+        if node is None:
+            raise ValueError(f"{e} não está na lista")
+        self.meio = None
+        return self.__delete_node(node)
+
+    def move_to_front(self, e):
+        node = self.__find(e)
+        if node is None:
+            raise ValueError(f"{e} não está na lista")
+        if node is not self.header.next:
+            self.meio = None
+            self.__relink(node, self.header, self.header.next)
+
+    def move_to_back(self, e):
+        node = self.__find(e)
+        if node is None:
+            raise ValueError(f"{e} não está na lista")
+        if node is not self.trailer.prev:
+            self.meio = None
+            self.__relink(node, self.trailer.prev, self.trailer)
+
+    # ---- operações com handles (os próprios nós) ----
+    # Com pool, um handle de um nó já removido pode ser reaproveitado por
+    # outro elemento; só use handles de nós que ainda estão na lista.
+
+    def add_first_handle(self, e):
+        self.add_first(e)
+        return self.header.next
+
+    def add_last_handle(self, e):
+        self.add_last(e)
+        return self.trailer.prev
+
+    def split_at(self, node, count=None):
+        # corta a lista antes de node: node..fim viram uma nova lista.
+        # O(1) se count (quantidade de elementos de node até o fim) for
+        # informado e a lista não for indexada; senão anda só pela parte cortada
+        if count is None or self.indice is not None:
+            count = 0
+            walk = node
+            while walk is not self.trailer:
+                count += 1
+                walk = walk.next
+        nova = LinkedList(self.pool, self.indice is not None, self.track_middle)
+        if count == 0:
+            return nova
+        self._before_change()
+        last = self.trailer.prev
+        predecessor = node.prev
+        predecessor.next = self.trailer
+        self.trailer.prev = predecessor
+        node.prev = nova.header
+        nova.header.next = node
+        last.next = nova.trailer
+        nova.trailer.prev = last
+        self.size -= count
+        nova.size = count
+        if self.indice is not None:
+            walk = node
+            while walk is not nova.trailer:
+                nodes = self.indice[walk.element]
+                del nodes[walk]
+                if not nodes:
+                    del self.indice[walk.element]
+                nova.indice.setdefault(walk.element, {})[walk] = None
+                walk = walk.next
+        self.meio = None
+        return nova
+
+    def splice(self, node, other):
+        # move todos os nós de other para antes de node (None = no fim)
+        if other.is_empty():
+            return
+        self._before_change()
+        other._before_change()
+        successor = self.trailer if node is None else node
+        predecessor = successor.prev
+        first = other.header.next
+        last = other.trailer.prev
+        first.prev = predecessor
+        last.next = successor
+        predecessor.next = first
+        successor.prev = last
+        self.size += other.size
+        if self.indice is not None:
+            if other.indice is not None:
+                for e, nodes in other.indice.items():
+                    self.indice.setdefault(e, {}).update(nodes)
+            else:
+                walk = first
+                while walk is not successor:
+                    self.indice.setdefault(walk.element, {})[walk] = None
+                    walk = walk.next
+        self.meio = None
+        other.header.next = other.trailer
+        other.trailer.prev = other.header
+        other.size = 0
+        other.meio = None
+        if other.indice is not None:
+            other.indice = {}
+
+    def rotate_to(self, node):
+        # gira a lista para node virar o primeiro, em O(1)
+        first = self.header.next
+        if node is first:
+            return
+        self._before_change()
+        last = self.trailer.prev
+        new_last = node.prev
+        last.next = first
+        first.prev = last
+        self.header.next = node
+        node.prev = self.header
+        new_last.next = self.trailer
+        self.trailer.prev = new_last
+        self.meio = None
+
+    def rotate(self, k=1):
+        # como deque.rotate: k > 0 gira para a direita, k < 0 para a esquerda;
+        # acha o novo primeiro pela ponta mais próxima e religa em O(1)
+        if self.size <= 1:
+            return
+        k %= self.size
+        if k == 0:
+            return
+        if k <= self.size - k:
+            node = self.__walk(self.trailer, -k)
+        else:
+            node = self.__walk(self.header, self.size - k + 1)
+        self.rotate_to(node)
+
+    def sort(self, key=None, reverse=False):
+        # merge sort bottom-up, estável e in-place: só religa os nós
+        if self.size < 2:
+            return
+        head = _detach_chain(self, key)
+        width = 1
+        while width < self.size:
+            dummy = Node(None, None, None)
+            tail = dummy
+            walk = head
+            try:
+                while walk is not None:
+                    left = walk
+                    right = _cut(left, width)
+                    walk = _cut(right, width)
+                    _, tail = _merge_chains(left, right, reverse, tail)
+            except Exception:
+                # comparação falhou: _merge_chains já juntou o par atual
+                # depois de tail; falta o resto de walk. Como list.sort, a
+                # lista fica válida com todos os elementos.
+                while tail.next is not None:
+                    tail = tail.next
+                tail.next = walk
+                _attach_chain(self, dummy.next)
+                self.meio = None
+                raise
+            head = dummy.next
+            width *= 2
+        _attach_chain(self, head)
+        self.meio = None
+
+    def snapshot(self):
+        # cópia imutável em O(1): o snapshot lê direto desta lista e só é
+        # copiado se a lista for mudar enquanto ele existir. Essa primeira
+        # escrita custa O(n), mas a cópia é uma só, dividida por todos os
+        # snapshots vivos da mesma versão
+        snap = PersistentList._lazy(self)
+        if self.snapshots is None:
+            self.snapshots = WeakSet()
+        self.snapshots.add(snap)
+        return snap
+
+    def _before_change(self):
+        # chamado antes de qualquer mudança na estrutura da lista
+        if self.snapshots:
+            # todos os snapshots pendentes são da versão atual: uma cópia serve
+            pendentes = [snap for snap in self.snapshots if snap.source is self]
+            if pendentes:
+                head = PersistentList._chain(self)
+                for snap in pendentes:
+                    snap._adopt(head)
+        self.snapshots = None
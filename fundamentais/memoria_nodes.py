@@ -0,0 +1,60 @@
+import time
+import tracemalloc
+
+from linkedlist import LinkedList
+from node import Node, NodePool
+
+
+# Nó "antigo", sem __slots__ (cada instância carrega um __dict__)
+class NodeDict:
+    def __init__(self, element, prev, next):
+        self.element = element
+        self.prev = prev
+        self.next = next
+
+
+def bytes_por_elemento(classe, n):
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    header = classe(None, None, None)
+    walk = header
+    for i in range(n):
+        novo = classe(i, walk, None)
+        walk.next = novo
+        walk = novo
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (depois - antes) / n
+
+
+def tempo_churn(pool, n, rodadas):
+    # simula uma fila: enche e esvazia a lista várias vezes
+    L = LinkedList(pool)
+    inicio = time.time()
+    for _ in range(rodadas):
+        for i in range(n):
+            L.add_last(i)
+        while not L.is_empty():
+            L.remove_first()
+    return time.time() - inicio
+
+
+def relatorio_memoria():
+    print(f"{'N':<10}{'Sem slots (B/elem)':<22}{'Com slots (B/elem)':<22}")
+    for exp in range(10, 21, 2):
+        N = 2 ** exp
+        antes = bytes_por_elemento(NodeDict, N)
+        depois = bytes_por_elemento(Node, N)
+        print(f"{N:<10}{antes:<22.1f}{depois:<22.1f}")
+
+    print()
+    print(f"{'N':<10}{'Sem pool (s)':<20}{'Com pool (s)':<20}")
+    for exp in range(10, 17, 2):
+        N = 2 ** exp
+        sem_pool = tempo_churn(None, N, 10)
+        com_pool = tempo_churn(NodePool(), N, 10)
+        print(f"{N:<10}{sem_pool:<20.6f}{com_pool:<20.6f}")
+
+
+if __name__ == "__main__":
+    relatorio_memoria()
@@ -1,12 +1,47 @@
 class Node:
+    # __slots__ evita o __dict__ por instância (bem menos bytes por nó)
+    __slots__ = ('element', 'prev', 'next')
+
     def __init__(self, element, prev, next):
       self.element = element
       self.prev = prev
       self.next = next
 
 class Node2:
-   def __init__(self, element):
+   __slots__ = ('element', 'next')
+
+   def __init__(self, element, next=None):
       self.element = element
       self.next = next
 
-  
\ No newline at end of file
+
+class NodePool:
+    # Free-list de nós: nós removidos voltam para cá e são reaproveitados,
+    # evitando alocar/desalocar um objeto novo a cada inserção
+    def __init__(self, max_size=1 << 16):
+        self.max_size = max_size
+        self.livres = []
+        self.criados = 0
+        self.reusados = 0
+
+    def __len__(self):
+        return len(self.livres)
+
+    def acquire(self, e, prev, next):
+        if self.livres:
+            node = self.livres.pop()
+            node.element = e
+            node.prev = prev
+            node.next = next
+            self.reusados += 1
+            return node
+        self.criados += 1
+        return Node(e, prev, next)
+
+    def release(self, node):
+        # o nó já deve vir "limpo" (sem referências) de __delete_node
+        if len(self.livres) < self.max_size:
+            self.livres.append(node)
+
+    def clear(self):
+        self.livres = []
@@ -0,0 +1,114 @@
+from node import Node2
+
+
+class PersistentList:
+    # Lista imutável sobre Node2: add_first/remove_first devolvem uma
+    # versão nova que compartilha a cauda com a anterior (nada é copiado).
+    def __init__(self, iterable=()):
+        self.head = None
+        self.size = 0
+        self.source = None
+        for e in reversed(list(iterable)):
+            self.head = Node2(e, self.head)
+            self.size += 1
+
+    @classmethod
+    def _version(cls, head, size):
+        nova = cls.__new__(cls)
+        nova.head = head
+        nova.size = size
+        nova.source = None
+        return nova
+
+    @classmethod
+    def _lazy(cls, source):
+        # snapshot de uma LinkedList: enquanto a lista não muda, lê direto
+        # dela; antes da primeira mudança a lista chama _materialize()
+        nova = cls._version(None, len(source))
+        nova.source = source
+        return nova
+
+    @staticmethod
+    def _chain(source):
+        # corrente de Node2 com os elementos de source, na mesma ordem
+        head = None
+        for e in reversed(source):
+            head = Node2(e, head)
+        return head
+
+    def _materialize(self):
+        if self.source is None:
+            return
+        self._adopt(PersistentList._chain(self.source))
+
+    def _adopt(self, head):
+        # passa a ler da corrente head (que pode ser dividida com outros)
+        self.head = head
+        self.source = None
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def first(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        if self.source is not None:
+            return self.source.first()
+        return self.head.element
+
+    def add_first(self, e):
+        self._materialize()
+        return PersistentList._version(Node2(e, self.head), self.size + 1)
+
+    def remove_first(self):
+        # devolve a versão sem o primeiro elemento (use first() para lê-lo)
+        if self.is_empty():
+          raise Exception("List is empty")
+        self._materialize()
+        return PersistentList._version(self.head.next, self.size - 1)
+
+    def __iter__(self):
+        count = 0
+        if self.source is not None:
+            it = iter(self.source)
+            # se a lista mudar no meio da iteração, continua na cópia
+            while count < self.size and self.source is not None:
+                yield next(it)
+                count += 1
+            if count == self.size:
+                return
+        walk = self.head
+        for _ in range(count):
+            walk = walk.next
+        while walk is not None:
+            yield walk.element
+            walk = walk.next
+
+    def __str__(self):
+        # Para imprimir a lista (print)
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def index(self, e):
+        # Busca sequencial
+        count = -1
+        for elemento in self:
+            count += 1
+            if elemento == e:
+                return count
+        return -1
+
+    def toArray(self):
+        return list(self)
+
+
+if __name__ == "__main__":
+    v0 = PersistentList([3, 4])
+    v1 = v0.add_first(2)
+    v2 = v1.add_first(1)
+    v3 = v2.remove_first().remove_first()
+
+    print(v0, v1, v2, v3)            # ( 3 4 ) ( 2 3 4 ) ( 1 2 3 4 ) ( 3 4 )
+    print(v3.head is v0.head)        # True: a cauda é compartilhada
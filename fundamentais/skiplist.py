@@ -0,0 +1,217 @@
+import random
+import time
+
+from linkedlist import LinkedList
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    # next[l] é o próximo nó no nível l e width[l] quantas posições ele pula
+    __slots__ = ('element', 'next', 'width')
+
+    def __init__(self, element, height):
+        self.element = element
+        self.next = [None] * height
+        self.width = [1] * height
+
+
+class IndexableSkipList:
+    # Skip list indexável: posição i em O(log n) esperado.
+    # O header tem "posição" 0 e o elemento de índice k tem posição k + 1;
+    # a largura até None conta como se houvesse um nó na posição size + 1.
+    def __init__(self, iterable=()):
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.levels = 1
+        self.size = 0
+        self.__build(list(iterable))
+
+    @staticmethod
+    def __random_height():
+        h = 1
+        while h < MAX_LEVEL and random.random() < 0.5:
+            h += 1
+        return h
+
+    def __build(self, elementos):
+        # construção em O(n): sorteia as alturas e liga nível por nível
+        n = len(elementos)
+        self.size = n
+        nodes = [SkipNode(e, self.__random_height()) for e in elementos]
+        self.levels = max((len(node.next) for node in nodes), default=1)
+        for lvl in range(self.levels):
+            anterior = self.header
+            pos_anterior = 0
+            for pos, node in enumerate(nodes, 1):
+                if len(node.next) > lvl:
+                    anterior.next[lvl] = node
+                    anterior.width[lvl] = pos - pos_anterior
+                    anterior = node
+                    pos_anterior = pos
+            anterior.next[lvl] = None
+            anterior.width[lvl] = n + 1 - pos_anterior
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __check_index(self, i):
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("índice fora da lista")
+        return i
+
+    def __node_at(self, i):
+        alvo = i + 1
+        node = self.header
+        pos = 0
+        for lvl in reversed(range(self.levels)):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= alvo:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return node
+
+    def __predecessors(self, i):
+        # para cada nível, o último nó antes da posição i + 1 (e sua posição)
+        chain = [self.header] * MAX_LEVEL
+        ranks = [0] * MAX_LEVEL
+        node = self.header
+        pos = 0
+        for lvl in reversed(range(self.levels)):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= i:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            chain[lvl] = node
+            ranks[lvl] = pos
+        return chain, ranks
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.size)
+            if step != 1 or start >= stop:
+                return IndexableSkipList(self[k] for k in range(start, stop, step))
+            resposta = [None] * (stop - start)
+            node = self.__node_at(start)
+            for k in range(stop - start):
+                resposta[k] = node.element
+                node = node.next[0]
+            return IndexableSkipList(resposta)
+        return self.__node_at(self.__check_index(i)).element
+
+    def __setitem__(self, i, e):
+        self.__node_at(self.__check_index(i)).element = e
+
+    def insert(self, i, e):
+        if i < 0:
+            i += self.size
+        i = max(0, min(i, self.size))
+        h = self.__random_height()
+        if h > self.levels:
+            for lvl in range(self.levels, h):
+                self.header.next[lvl] = None
+                self.header.width[lvl] = self.size + 1
+            self.levels = h
+        chain, ranks = self.__predecessors(i)
+        newest = SkipNode(e, h)
+        for lvl in range(h):
+            anterior = chain[lvl]
+            newest.next[lvl] = anterior.next[lvl]
+            newest.width[lvl] = ranks[lvl] + anterior.width[lvl] - i
+            anterior.next[lvl] = newest
+            anterior.width[lvl] = i + 1 - ranks[lvl]
+        for lvl in range(h, self.levels):
+            chain[lvl].width[lvl] += 1
+        self.size += 1
+
+    def pop(self, i=-1):
+        if self.is_empty():
+          raise Exception("List is empty")
+        i = self.__check_index(i)
+        chain, _ = self.__predecessors(i)
+        node = chain[0].next[0]
+        h = len(node.next)
+        for lvl in range(h):
+            chain[lvl].width[lvl] += node.width[lvl] - 1
+            chain[lvl].next[lvl] = node.next[lvl]
+        for lvl in range(h, self.levels):
+            chain[lvl].width[lvl] -= 1
+        while self.levels > 1 and self.header.next[self.levels - 1] is None:
+            self.levels -= 1
+        self.size -= 1
+        element = node.element
+        node.element = node.next = node.width = None
+        return element
+
+    def add_first(self, e):
+        self.insert(0, e)
+
+    def add_last(self, e):
+        self.insert(self.size, e)
+
+    def remove_first(self):
+        return self.pop(0)
+
+    def remove_last(self):
+        return self.pop(-1)
+
+    def __iter__(self):
+        walk = self.header.next[0]
+        while walk is not None:
+            yield walk.element
+            walk = walk.next[0]
+
+    def __str__(self):
+        # Para imprimir a lista (print)
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def index(self, e):
+        # Busca sequencial
+        count = -1
+        for elemento in self:
+            count += 1
+            if elemento == e:
+                return count
+        return -1
+
+    def clear(self):
+        self.__init__()
+
+    def toArray(self):
+        return list(self)
+
+
+# -------------------------------
+# Edições em posições aleatórias
+# -------------------------------
+def rodar_testes():
+    print(f"{'N':<10}{'Lista ligada (s)':<20}{'Skip list (s)':<20}")
+    for exp in range(8, 17, 2):
+        N = 2 ** exp
+        operacoes = 1000
+        posicoes = [random.randrange(N) for _ in range(operacoes)]
+
+        # LinkedList: acesso à posição i só andando nó a nó
+        L = LinkedList()
+        for i in range(N):
+            L.add_last(i)
+        inicio = time.time()
+        for p in posicoes:
+            walk = L.header.next
+            for _ in range(p):
+                walk = walk.next
+        tempo_lista = time.time() - inicio
+
+        S = IndexableSkipList(range(N))
+        inicio = time.time()
+        for p in posicoes:
+            S.insert(p, S.pop(p))
+        tempo_skip = time.time() - inicio
+
+        print(f"{N:<10}{tempo_lista:<20.6f}{tempo_skip:<20.6f}")
+
+
+if __name__ == "__main__":
+    rodar_testes()
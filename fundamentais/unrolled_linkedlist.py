@@ -0,0 +1,225 @@
+import time
+
+from linkedlist import LinkedList
+
+
+class Block:
+    # cada nó guarda até B elementos em uma lista pequena
+    __slots__ = ('elements', 'prev', 'next')
+
+    def __init__(self, elements, prev, next):
+        self.elements = elements
+        self.prev = prev
+        self.next = next
+
+
+class UnrolledLinkedList:
+    def __init__(self, block_size=64):
+        if block_size < 2:
+            raise ValueError("block_size deve ser pelo menos 2")
+        self.block_size = block_size
+        self.header = Block(None, None, None)
+        self.trailer = Block(None, None, None)
+        self.header.next = self.trailer
+        self.trailer.prev = self.header
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __insert_block_between(self, elements, predecessor, successor):
+        newest = Block(elements, predecessor, successor)
+        predecessor.next = newest
+        successor.prev = newest
+        return newest
+
+    def __delete_block(self, block):
+        block.prev.next = block.next
+        block.next.prev = block.prev
+        block.prev = block.next = block.elements = None
+
+    def __split(self, block):
+        # bloco cheio demais: metade de cima vai para um bloco novo
+        meio = len(block.elements) // 2
+        self.__insert_block_between(block.elements[meio:], block, block.next)
+        del block.elements[meio:]
+
+    def __merge(self, block):
+        # bloco com menos de B/2 elementos: junta com o vizinho da direita
+        # (ou pega emprestado dele se a junção estourasse B)
+        if not block.elements:
+            self.__delete_block(block)
+            return
+        vizinho = block.next
+        if vizinho is self.trailer:
+            return
+        if len(block.elements) + len(vizinho.elements) <= self.block_size:
+            block.elements.extend(vizinho.elements)
+            self.__delete_block(vizinho)
+        else:
+            falta = self.block_size // 2 - len(block.elements)
+            block.elements.extend(vizinho.elements[:falta])
+            del vizinho.elements[:falta]
+
+    def __locate(self, i):
+        # devolve (bloco, posição dentro do bloco) do i-ésimo elemento
+        if i < self.size // 2:
+            walk = self.header.next
+            while i >= len(walk.elements):
+                i -= len(walk.elements)
+                walk = walk.next
+            return walk, i
+        i = self.size - i
+        walk = self.trailer.prev
+        while i > len(walk.elements):
+            i -= len(walk.elements)
+            walk = walk.prev
+        return walk, len(walk.elements) - i
+
+    def first(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.header.next.elements[0]
+
+    def last(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.trailer.prev.elements[-1]
+
+    def add_first(self, e):
+        block = self.header.next
+        if block is self.trailer or len(block.elements) >= self.block_size:
+            block = self.__insert_block_between([], self.header, block)
+        block.elements.insert(0, e)
+        self.size += 1
+
+    def add_last(self, e):
+        block = self.trailer.prev
+        if block is self.header or len(block.elements) >= self.block_size:
+            block = self.__insert_block_between([], block, self.trailer)
+        block.elements.append(e)
+        self.size += 1
+
+    def remove_first(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        block = self.header.next
+        element = block.elements.pop(0)
+        if not block.elements:
+            self.__delete_block(block)
+        self.size -= 1
+        return element
+
+    def remove_last(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        block = self.trailer.prev
+        element = block.elements.pop()
+        if not block.elements:
+            self.__delete_block(block)
+        self.size -= 1
+        return element
+
+    def insert(self, i, e):
+        if i < 0:
+            i += self.size
+        if i <= 0:
+            return self.add_first(e)
+        if i >= self.size:
+            return self.add_last(e)
+        block, j = self.__locate(i)
+        block.elements.insert(j, e)
+        self.size += 1
+        if len(block.elements) > self.block_size:
+            self.__split(block)
+
+    def pop(self, i=-1):
+        if self.is_empty():
+          raise Exception("List is empty")
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("índice fora da lista")
+        block, j = self.__locate(i)
+        element = block.elements.pop(j)
+        self.size -= 1
+        if len(block.elements) < self.block_size // 2:
+            self.__merge(block)
+        return element
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("índice fora da lista")
+        block, j = self.__locate(i)
+        return block.elements[j]
+
+    def __iter__(self):
+        walk = self.header.next
+        while walk is not self.trailer:
+            yield from walk.elements
+            walk = walk.next
+
+    def __str__(self):
+        # Para imprimir a lista (print)
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def index(self, e):
+        # Busca sequencial, mas um salto de ponteiro por bloco
+        count = 0
+        walk = self.header.next
+        while walk is not self.trailer:
+            if e in walk.elements:
+                return count + walk.elements.index(e)
+            count += len(walk.elements)
+            walk = walk.next
+        return -1
+
+    def clear(self):
+        self.header.next = self.trailer
+        self.trailer.prev = self.header
+        self.size = 0
+
+    def toArray(self):
+        resposta = []
+        walk = self.header.next
+        while walk is not self.trailer:
+            resposta.extend(walk.elements)
+            walk = walk.next
+        return resposta
+
+
+# -------------------------------
+# Comparação com a LinkedList
+# -------------------------------
+def rodar_testes():
+    print(f"{'N':<10}{'Estrutura':<16}{'add_last (s)':<16}{'index (s)':<16}{'toArray (s)':<16}{'str (s)':<16}")
+    for exp in range(10, 17, 2):
+        N = 2 ** exp
+        for nome, L in (("LinkedList", LinkedList()), ("Unrolled", UnrolledLinkedList())):
+            inicio = time.time()
+            for i in range(N):
+                L.add_last(i)
+            tempo_add = time.time() - inicio
+
+            inicio = time.time()
+            L.index(N - 1)
+            tempo_index = time.time() - inicio
+
+            inicio = time.time()
+            L.toArray()
+            tempo_array = time.time() - inicio
+
+            inicio = time.time()
+            str(L)
+            tempo_str = time.time() - inicio
+
+            print(f"{N:<10}{nome:<16}{tempo_add:<16.6f}{tempo_index:<16.6f}{tempo_array:<16.6f}{tempo_str:<16.6f}")
+
+
+if __name__ == "__main__":
+    rodar_testes()
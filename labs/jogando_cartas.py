@@ -1,3 +1,8 @@
+import sys
+import time
+from array import array
+from collections import deque
+
 class Node:
     def __init__(self, element, prev, next):
       self.element = element
@@ -118,6 +123,136 @@ class LinkedList:
         elemento = elemento.next
       return resposta
 
+
+class CircularNode:
+    __slots__ = ('element', 'next')
+
+    def __init__(self, element, next):
+        self.element = element
+        self.next = next
+
+
+class CircularLinkedList:
+    # Lista circular simples com cursor. Guardamos o nó ANTERIOR ao cursor
+    # (self.tail), então remover o nó do cursor é só religar um ponteiro.
+    def __init__(self, iterable=()):
+        self.tail = None
+        self.size = 0
+        for e in iterable:
+            self.add_last(e)
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def current(self):
+        if self.is_empty():
+          raise Exception("List is empty")
+        return self.tail.next.element
+
+    def add_last(self, e):
+        # insere logo antes do cursor (no "fim" da volta)
+        if self.tail is None:
+            newest = CircularNode(e, None)
+            newest.next = newest
+        else:
+            newest = CircularNode(e, self.tail.next)
+            self.tail.next = newest
+        self.tail = newest
+        self.size += 1
+
+    def advance(self, k=1):
+        # anda o cursor k posições (O(k), sem alocar nada)
+        if self.is_empty():
+          raise Exception("List is empty")
+        for _ in range(k % self.size):
+            self.tail = self.tail.next
+
+    def remove_at_cursor(self):
+        # remove o nó do cursor; o cursor passa para o seguinte
+        if self.is_empty():
+          raise Exception("List is empty")
+        old = self.tail.next
+        if old is self.tail:
+            self.tail = None
+        else:
+            self.tail.next = old.next
+        self.size -= 1
+        element = old.element
+        old.next = old.element = None
+        return element
+
+    def __iter__(self):
+        if self.is_empty():
+            return
+        walk = self.tail.next
+        for _ in range(self.size):
+            yield walk.element
+            walk = walk.next
+
+    def __str__(self):
+        return '( ' + ''.join(f'{e} ' for e in self) + ')'
+
+    def toArray(self):
+        return list(self)
+
+class RingBuffer:
+    # Fila de capacidade fixa num array circular: head aponta para o
+    # primeiro elemento e tail para a próxima posição livre, então
+    # enqueue/dequeue são O(1) e nada é deslocado.
+    # typecode='q' guarda ints compactos; typecode=None aceita qualquer objeto.
+    def __init__(self, capacity, typecode='q'):
+        if capacity < 1:
+            raise ValueError("capacity deve ser pelo menos 1")
+        if typecode is None:
+            self.dados = [None] * capacity
+        else:
+            self.dados = array(typecode, [0]) * capacity
+        self.capacity = capacity
+        self.head = 0
+        self.tail = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
+
+    def is_full(self):
+        return self.size == self.capacity
+
+    def first(self):
+        if self.is_empty():
+          raise Exception("Queue is empty")
+        return self.dados[self.head]
+
+    def enqueue(self, e):
+        if self.is_full():
+          raise Exception("Queue is full")
+        self.dados[self.tail] = e
+        self.tail += 1
+        if self.tail == self.capacity:
+            self.tail = 0
+        self.size += 1
+
+    def dequeue(self):
+        if self.is_empty():
+          raise Exception("Queue is empty")
+        e = self.dados[self.head]
+        self.head += 1
+        if self.head == self.capacity:
+            self.head = 0
+        self.size -= 1
+        return e
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self.dados[(self.head + i) % self.capacity]
+
+
 def jogar_cartas_fora_lista(baralho):
     descartadas = []
     while len(baralho) > 1:
@@ -125,7 +260,10 @@ def jogar_cartas_fora_lista(baralho):
         baralho.add_last(baralho.remove_first())
     return descartadas, baralho.first()
 
-def jogar_cartas_fora_array(baralho2):
+def jogar_cartas_fora_array(baralho2, backend='list'):
+    # backend: 'list' (pop(0), O(n²)), 'deque', 'ring' (RingBuffer) ou 'linked'
+    if backend != 'list':
+        return jogar_cartas_fora_fila(baralho2, backend)
     descartadas = []
     count = 0
     restante =0
@@ -137,27 +275,130 @@ def jogar_cartas_fora_array(baralho2):
 
     return descartadas, restante
 
+def jogar_cartas_fora_fila(baralho, backend):
+    if backend == 'deque':
+        fila = deque(baralho)
+        retirar, colocar = fila.popleft, fila.append
+    elif backend == 'ring':
+        cartas = list(baralho)
+        try:
+            fila = RingBuffer(max(len(cartas), 1))
+            for carta in cartas:
+                fila.enqueue(carta)
+        except (TypeError, OverflowError):
+            # cartas que não são int de 64 bits
+            fila = RingBuffer(max(len(cartas), 1), typecode=None)
+            for carta in cartas:
+                fila.enqueue(carta)
+        retirar, colocar = fila.dequeue, fila.enqueue
+    elif backend == 'linked':
+        fila = LinkedList()
+        for carta in baralho:
+            fila.add_last(carta)
+        return jogar_cartas_fora_lista(fila)
+    else:
+        raise ValueError(f"backend desconhecido: {backend}")
+    descartadas = []
+    while len(fila) > 1:
+        descartadas.append(retirar())
+        colocar(retirar())
+    return descartadas, retirar()
+
+
+def jogar_cartas_fora_circular(baralho):
+    # descarta a carta do topo e passa a seguinte para baixo: só religa ponteiros
+    descartadas = []
+    while len(baralho) > 1:
+        descartadas.append(baralho.remove_at_cursor())
+        baralho.advance()
+    return descartadas, baralho.current()
+
+
+# -------------------------------
+# Comparação dos backends (como em maior_prefixo_comum.py)
+# -------------------------------
+def rodar_testes_backends(max_exp=22):
+    # 'list' é O(n²) e só roda até 2^16
+    backends = ('list', 'deque', 'ring', 'linked')
+    print(f"{'N':<10}" + ''.join(f"{f'{b} (s)':<16}" for b in backends))
+    for exp in range(1, max_exp + 1):
+        N = 2 ** exp
+        linha = f"{N:<10}"
+        for backend in backends:
+            if backend == 'list' and exp > 16:
+                linha += f"{'-':<16}"
+                continue
+            baralho = list(range(1, N + 1))
+            inicio = time.time()
+            jogar_cartas_fora_array(baralho, backend)
+            linha += f"{time.time() - inicio:<16.6f}"
+        print(linha)
+
+
+# -------------------------------
+# Comparação das três versões
+# -------------------------------
+def rodar_testes(max_exp=6):
+    # a versão com array é O(n²) (pop(0)), então só roda até 10^5
+    print(f"{'N':<12}{'Array (s)':<16}{'LinkedList (s)':<18}{'Circular (s)':<16}")
+    for exp in range(3, max_exp + 1):
+        N = 10 ** exp
+
+        if exp <= 5:
+            inicio = time.time()
+            jogar_cartas_fora_array(list(range(1, N + 1)))
+            tempo_array = f"{time.time() - inicio:.6f}"
+        else:
+            tempo_array = "-"
+
+        L = LinkedList()
+        for i in range(1, N + 1):
+            L.add_last(i)
+        inicio = time.time()
+        jogar_cartas_fora_lista(L)
+        tempo_lista = time.time() - inicio
+        del L
+
+        C = CircularLinkedList(range(1, N + 1))
+        inicio = time.time()
+        jogar_cartas_fora_circular(C)
+        tempo_circular = time.time() - inicio
+        del C
+
+        print(f"{N:<12}{tempo_array:<16}{tempo_lista:<18.6f}{tempo_circular:<16.6f}")
+
+
+if __name__ == "__main__":
+    L = [1,2,3,4,5,6,7]
+    descartadas, restante = jogar_cartas_fora_array(L)
+    print(descartadas)
+    print(restante)
+
+
+    L = LinkedList()
+    L.add_last(1)
+    L.add_last(2)
+    L.add_last(3)
+    L.add_last(4)
+    L.add_last(5)
+    L.add_last(6)
+    L.add_last(7)
 
-L = [1,2,3,4,5,6,7]
-descartadas, restante = jogar_cartas_fora_array(L)
-print(descartadas)
-print(restante)
+    print("Antes do jogo:")
+    print("L =", L)
 
+    descartadas, restante = jogar_cartas_fora_lista(L)
 
-L = LinkedList()
-L.add_last(1)
-L.add_last(2)
-L.add_last(3)
-L.add_last(4)
-L.add_last(5)
-L.add_last(6)
-L.add_last(7)
+    print("Depois do jogo:")
+    print("Descartadas:", descartadas)   # [1, 3, 5, 7, 4, 2]
+    print("Restante:", restante)         # 6
 
-print("Antes do jogo:")
-print("L =", L)
+    C = CircularLinkedList([1, 2, 3, 4, 5, 6, 7])
+    print("Circular:", jogar_cartas_fora_circular(C))   # ([1, 3, 5, 7, 4, 2], 6)
 
-descartadas, restante = jogar_cartas_fora_lista(L)
+    for backend in ('list', 'deque', 'ring', 'linked'):
+        print(backend, jogar_cartas_fora_array([1, 2, 3, 4, 5, 6, 7], backend))
 
-print("Depois do jogo:")
-print("Descartadas:", descartadas)   # [1, 3, 5, 7, 4, 2]
-print("Restante:", restante)         # 6
\ No newline at end of file
+    # python jogando_cartas.py 7  -> vai até baralhos de 10^7 cartas
+    rodar_testes(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
+    rodar_testes_backends()
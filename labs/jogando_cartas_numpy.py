@@ -0,0 +1,66 @@
+import time
+
+import numpy as np
+
+from jogando_cartas import jogar_cartas_fora_array
+
+
+# A ordem em que as POSIÇÕES saem do baralho só depende do tamanho n, e não
+# das cartas. Então calculamos essa permutação uma vez (com fatiamentos de
+# índices, como em jogando_cartas_solver.py) e aplicamos a todos os baralhos
+# com um único fancy indexing.
+
+def ordem_posicoes(n):
+    # posições na ordem de descarte; a última é a carta que sobra
+    if n < 1:
+        raise ValueError("baralho vazio")
+    atual = np.arange(n)
+    partes = []
+    while len(atual) > 1:
+        partes.append(atual[0::2])
+        ficam = atual[1::2]
+        if len(atual) % 2 == 1:
+            ficam = np.roll(ficam, -1)
+        atual = ficam
+    partes.append(atual)
+    return np.concatenate(partes)
+
+
+def jogar_cartas_fora_numpy(baralhos):
+    # baralhos: array 2-D (um baralho por linha, todos do mesmo tamanho)
+    # devolve (descartadas, restantes): descartadas[i] é a sequência de
+    # descarte do baralho i e restantes[i] a carta que sobrou
+    baralhos = np.asarray(baralhos)
+    if baralhos.ndim != 2:
+        raise ValueError("baralhos deve ser um array 2-D")
+    resultado = baralhos[:, ordem_posicoes(baralhos.shape[1])]
+    return resultado[:, :-1], resultado[:, -1]
+
+
+def rodar_testes():
+    rng = np.random.default_rng(0)
+    print(f"{'Baralhos':<10}{'Cartas':<10}{'Loop Python (s)':<18}{'NumPy (s)':<12}")
+    for quantos, n in ((10, 100), (1000, 100), (10000, 1000), (1000, 10000)):
+        baralhos = rng.permuted(np.tile(np.arange(1, n + 1), (quantos, 1)), axis=1)
+
+        inicio = time.time()
+        descartadas, restantes = jogar_cartas_fora_numpy(baralhos)
+        tempo_numpy = time.time() - inicio
+
+        inicio = time.time()
+        for i, linha in enumerate(baralhos.tolist()):
+            esperado = jogar_cartas_fora_array(linha, 'deque')
+            if i < 20:
+                assert descartadas[i].tolist() == esperado[0]
+                assert restantes[i] == esperado[1]
+        tempo_loop = time.time() - inicio
+
+        print(f"{quantos:<10}{n:<10}{tempo_loop:<18.6f}{tempo_numpy:<12.6f}")
+
+
+if __name__ == "__main__":
+    descartadas, restantes = jogar_cartas_fora_numpy([[1, 2, 3, 4, 5, 6, 7],
+                                                     [7, 6, 5, 4, 3, 2, 1]])
+    print(descartadas)          # [[1 3 5 7 4 2] [7 5 3 1 4 6]]
+    print(restantes)            # [6 2]
+    rodar_testes()
@@ -0,0 +1,95 @@
+import random
+import time
+
+from jogando_cartas import LinkedList, jogar_cartas_fora_array, jogar_cartas_fora_lista
+
+
+# O jogo é um Josephus com passo 2: em cada volta pelo baralho saem as
+# cartas das posições pares e as ímpares continuam, na mesma ordem.
+# Se a volta tinha tamanho ímpar, a última carta sai e a primeira que ficou
+# vai para baixo antes da próxima volta (rotação de 1).
+
+def sobrevivente_posicao(n):
+    # posição (0-indexada) da carta que sobra em um baralho de n cartas:
+    # com n = 2^m + l (0 <= l < 2^m), é 2l - 1, ou n - 1 se l == 0. O(log n)
+    if n < 1:
+        raise ValueError("baralho vazio")
+    l = n - (1 << (n.bit_length() - 1))
+    return n - 1 if l == 0 else 2 * l - 1
+
+
+def jogar_cartas_fora_solver(baralho):
+    # mesma saída de jogar_cartas_fora_lista, em O(n) e sem fila:
+    # cada volta é só um fatiamento, e o tamanho cai pela metade
+    atual = list(baralho)
+    if not atual:
+        raise Exception("List is empty")
+    descartadas = []
+    while len(atual) > 1:
+        descartadas.extend(atual[0::2])
+        ficam = atual[1::2]
+        if len(atual) % 2 == 1:
+            ficam = ficam[1:] + ficam[:1]
+        atual = ficam
+    return descartadas, atual[0]
+
+
+def solve_many(sizes, so_sobrevivente=False):
+    # resolve vários baralhos 1..n de uma vez; com so_sobrevivente=True
+    # devolve só a carta restante de cada um, em O(log n) por baralho
+    if so_sobrevivente:
+        return [sobrevivente_posicao(n) + 1 for n in sizes]
+    return [jogar_cartas_fora_solver(range(1, n + 1)) for n in sizes]
+
+
+def verificar(max_n=300, aleatorios=50):
+    # checagem diferencial contra as duas simulações de jogando_cartas.py
+    for n in range(1, max_n + 1):
+        baralho = list(range(1, n + 1))
+        esperado_lista = jogar_cartas_fora_lista(_lista(baralho))
+        assert jogar_cartas_fora_solver(baralho) == esperado_lista, n
+        assert sobrevivente_posicao(n) + 1 == esperado_lista[1], n
+        if n > 1:
+            # com 1 carta a versão com array devolve 0 em vez da carta
+            assert jogar_cartas_fora_array(list(baralho)) == esperado_lista, n
+    for _ in range(aleatorios):
+        baralho = random.sample(range(10 * max_n), random.randint(2, max_n))
+        assert jogar_cartas_fora_solver(baralho) == jogar_cartas_fora_array(list(baralho))
+    assert solve_many(range(1, 50), True) == [r for _, r in solve_many(range(1, 50))]
+    return True
+
+
+def _lista(baralho):
+    L = LinkedList()
+    for carta in baralho:
+        L.add_last(carta)
+    return L
+
+
+def rodar_testes():
+    print(f"{'N':<12}{'Array (s)':<16}{'Solver (s)':<16}{'Só sobrevivente (s)':<20}")
+    for exp in range(1, 23):
+        N = 2 ** exp
+
+        if N <= 2 ** 16:
+            inicio = time.time()
+            jogar_cartas_fora_array(list(range(1, N + 1)))
+            tempo_array = f"{time.time() - inicio:.6f}"
+        else:
+            tempo_array = "-"
+
+        inicio = time.time()
+        jogar_cartas_fora_solver(range(1, N + 1))
+        tempo_solver = time.time() - inicio
+
+        inicio = time.time()
+        sobrevivente_posicao(N)
+        tempo_sobrevivente = time.time() - inicio
+
+        print(f"{N:<12}{tempo_array:<16}{tempo_solver:<16.6f}{tempo_sobrevivente:<20.6f}")
+
+
+if __name__ == "__main__":
+    print(jogar_cartas_fora_solver([1, 2, 3, 4, 5, 6, 7]))   # ([1, 3, 5, 7, 4, 2], 6)
+    print("Checagem diferencial:", verificar())
+    rodar_testes()